@@ -0,0 +1,44 @@
+"""Add composite index for latest valuations per company.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+
+Adds (portfolio_company_id, created_at DESC) on valuations so the
+company history query can read rows in order from a single index scan.
+The index is built CONCURRENTLY to avoid locking writes on the table.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_valuations_portco_created_desc",
+            "valuations",
+            ["portfolio_company_id", "created_at"],
+            postgresql_ops={"created_at": "DESC"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_valuations_portco_created_desc",
+            table_name="valuations",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
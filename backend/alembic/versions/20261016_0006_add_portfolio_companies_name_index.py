@@ -0,0 +1,44 @@
+"""Add index on portfolio_companies.name.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16
+
+Saving a valuation looks up the portfolio company by name before
+creating one. The index turns that lookup into a single index seek.
+It is not unique because existing data may already contain duplicate
+names. It is built CONCURRENTLY to avoid blocking writes.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_portfolio_companies_name",
+            "portfolio_companies",
+            ["name"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_portfolio_companies_name",
+            table_name="portfolio_companies",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -29,7 +29,7 @@ from src.exceptions import (
 )
 from src.models import ComparableSet, CompanyData, ValuationResult
 from src.services.portfolio_companies import PortfolioCompanyService
-from src.services.valuations import ValuationService, convert_result_for_response
+from src.services.valuations import ValuationService
 
 router = APIRouter()
 
@@ -146,18 +146,17 @@ def run_batch_valuation(
     """
     results: list[ValuationResult | ErrorResponse] = []
 
-    for company_id in request.company_ids:
-        try:
-            result = engine.run(company_id)
-            results.append(result)
-        except ValuationError as e:
+    for result in engine.run_batch(request.company_ids):
+        if isinstance(result, ValuationError):
             results.append(
                 ErrorResponse(
-                    error_type=e.__class__.__name__,
-                    message=e.message,
-                    details=e.details,
+                    error_type=result.__class__.__name__,
+                    message=result.message,
+                    details=result.details,
                 )
             )
+        else:
+            results.append(result)
 
     return results
 
@@ -374,8 +373,9 @@ async def run_and_save_valuation(
         400: Other valuation errors.
     """
     try:
-        result, saved_valuation_id = await service.run_and_save_valuation(company_data)
-        converted = convert_result_for_response(result)
+        result, saved_valuation_id, converted = await service.run_and_save_valuation(
+            company_data
+        )
 
         return SavedValuationResponse(
             id=saved_valuation_id,
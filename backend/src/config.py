@@ -43,6 +43,12 @@ class ValuationConfig(BaseModel):
         description="Percentile to use for comparable multiple (50 = median)"
     )
 
+    # Audit trail
+    include_audit_trail: bool = Field(
+        default=True,
+        description="Record step-by-step audit trails in method results"
+    )
+
     # Confidence thresholds
     high_confidence_spread: Decimal = Field(
         default=Decimal("0.15"),
@@ -10,14 +10,16 @@ All database queries are defined here to:
 from datetime import date
 from decimal import Decimal
 from typing import Any, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
+import orjson
 from sqlalchemy import desc, func, select
 from sqlalchemy.exc import DBAPIError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload
 
 from src.utils.retry import async_retry_on_exception
+from src.utils.serialization import RawJSON
 
 from . import models
 
@@ -80,7 +82,7 @@ async def sector_exists(db: AsyncSession, sector_id: str) -> bool:
 # ============================================================================
 
 
-@async_retry_on_exception((OperationalError, DBAPIError))
+@async_retry_on_exception((OperationalError, DBAPIError), jitter=True)
 async def create_portfolio_company(
     db: AsyncSession,
     name: str,
@@ -106,7 +108,41 @@ async def create_portfolio_company(
     Returns:
         The created PortfolioCompany.
     """
+    company = _add_portfolio_company(
+        db,
+        name=name,
+        sector_id=sector_id,
+        stage=stage,
+        founded_date=founded_date,
+        financials=financials,
+        last_round=last_round,
+        adjustments=adjustments,
+    )
+    await db.flush()
+    await db.refresh(company)
+    return company
+
+
+def _add_portfolio_company(
+    db: AsyncSession,
+    name: str,
+    sector_id: str,
+    stage: str,
+    founded_date: Optional[date] = None,
+    financials: Optional[dict[str, Any]] = None,
+    last_round: Optional[dict[str, Any]] = None,
+    adjustments: Optional[list[dict[str, Any]]] = None,
+) -> models.PortfolioCompany:
+    """Add a new portfolio company to the session without flushing.
+
+    The id is assigned up front so rows added in the same flush can
+    reference it.
+
+    Returns:
+        The pending PortfolioCompany.
+    """
     company = models.PortfolioCompany(
+        id=uuid4(),
         name=name,
         sector_id=sector_id,
         stage=stage,
@@ -116,8 +152,6 @@ async def create_portfolio_company(
         adjustments=adjustments or [],
     )
     db.add(company)
-    await db.flush()
-    await db.refresh(company)
     return company
 
 
@@ -139,6 +173,44 @@ async def get_portfolio_company_by_id(
     return result.scalar_one_or_none()
 
 
+async def get_portfolio_company_id_by_name(
+    db: AsyncSession, name: str
+) -> Optional[UUID]:
+    """Get the ID of the most recently created portfolio company with a given name.
+
+    Args:
+        db: Database session.
+        name: The company name to match exactly.
+
+    Returns:
+        The company UUID if found, None otherwise.
+    """
+    result = await db.execute(
+        select(models.PortfolioCompany.id)
+        .where(models.PortfolioCompany.name == name)
+        .order_by(desc(models.PortfolioCompany.created_at))
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def get_random_portfolio_company(
+    db: AsyncSession,
+) -> Optional[models.PortfolioCompany]:
+    """Get a random portfolio company, chosen by the database.
+
+    Args:
+        db: Database session.
+
+    Returns:
+        A random PortfolioCompany, or None if there are none.
+    """
+    result = await db.execute(
+        select(models.PortfolioCompany).order_by(func.random()).limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
 async def list_portfolio_companies(
     db: AsyncSession, limit: int = 50, offset: int = 0
 ) -> list[models.PortfolioCompany]:
@@ -203,7 +275,7 @@ async def delete_portfolio_company(db: AsyncSession, company_id: UUID) -> bool:
 # ============================================================================
 
 
-@async_retry_on_exception((OperationalError, DBAPIError))
+@async_retry_on_exception((OperationalError, DBAPIError), jitter=True)
 async def create_valuation(
     db: AsyncSession,
     portfolio_company_id: UUID,
@@ -246,6 +318,50 @@ async def create_valuation(
     Returns:
         The created Valuation.
     """
+    valuation = _add_valuation(
+        db,
+        portfolio_company_id=portfolio_company_id,
+        company_name=company_name,
+        input_snapshot=input_snapshot,
+        input_hash=input_hash,
+        primary_value=primary_value,
+        primary_method=primary_method,
+        value_range_low=value_range_low,
+        value_range_high=value_range_high,
+        overall_confidence=overall_confidence,
+        summary=summary,
+        method_results=method_results,
+        skipped_methods=skipped_methods,
+        config_snapshot=config_snapshot,
+        valuation_date=valuation_date,
+    )
+    await db.flush()
+    await db.refresh(valuation)
+    return valuation
+
+
+def _add_valuation(
+    db: AsyncSession,
+    portfolio_company_id: UUID,
+    company_name: str,
+    input_snapshot: dict[str, Any] | RawJSON,
+    input_hash: str,
+    primary_value: Decimal,
+    primary_method: str,
+    value_range_low: Optional[Decimal],
+    value_range_high: Optional[Decimal],
+    overall_confidence: str,
+    summary: dict[str, Any],
+    method_results: list[dict[str, Any]],
+    skipped_methods: Optional[list[dict[str, Any]]] = None,
+    config_snapshot: Optional[dict[str, Any]] = None,
+    valuation_date: Optional[date] = None,
+) -> models.Valuation:
+    """Add a new valuation record to the session without flushing.
+
+    Returns:
+        The pending Valuation.
+    """
     valuation = models.Valuation(
         portfolio_company_id=portfolio_company_id,
         company_name=company_name,
@@ -263,8 +379,94 @@ async def create_valuation(
         valuation_date=valuation_date or date.today(),
     )
     db.add(valuation)
+    return valuation
+
+
+@async_retry_on_exception((OperationalError, DBAPIError), jitter=True)
+async def create_valuation_for_company(
+    db: AsyncSession,
+    company_name: str,
+    sector_id: str,
+    stage: str,
+    input_snapshot: dict[str, Any] | RawJSON,
+    primary_value: Decimal,
+    primary_method: str,
+    value_range_low: Optional[Decimal],
+    value_range_high: Optional[Decimal],
+    overall_confidence: str,
+    summary: dict[str, Any],
+    method_results: list[dict[str, Any]],
+    skipped_methods: Optional[list[dict[str, Any]]] = None,
+    config_snapshot: Optional[dict[str, Any]] = None,
+    valuation_date: Optional[date] = None,
+) -> models.Valuation:
+    """Save a valuation, creating its portfolio company if none exists.
+
+    The company is matched by name (newest first). A missing company and
+    the valuation are inserted in a single flush, and neither row is
+    refreshed afterwards, so server-generated columns such as
+    ``created_at`` are not loaded on the returned object.
+
+    Args:
+        db: Database session.
+        company_name: Name of the company being valued.
+        sector_id: Sector identifier, used if the company is created.
+        stage: Company stage, used if the company is created.
+        input_snapshot: Complete input data (JSONB), as a dict or as
+            already-serialized RawJSON. Its financials, last_round and
+            adjustments seed a newly created company.
+        primary_value: The primary valuation result.
+        primary_method: Method used for primary value.
+        value_range_low: Lower bound of valuation range.
+        value_range_high: Upper bound of valuation range.
+        overall_confidence: Confidence level (HIGH/MEDIUM/LOW).
+        summary: Summary data (JSONB).
+        method_results: List of method results (JSONB).
+        skipped_methods: Optional list of skipped methods (JSONB).
+        config_snapshot: Optional config snapshot (JSONB).
+        valuation_date: Optional valuation date (defaults to today).
+
+    Returns:
+        The created Valuation.
+    """
+    company_id = await get_portfolio_company_id_by_name(db, company_name)
+
+    if company_id is None:
+        # Only parse a serialized snapshot when a company has to be seeded
+        snapshot = (
+            orjson.loads(str(input_snapshot))
+            if isinstance(input_snapshot, str)
+            else input_snapshot
+        )
+        company_id = _add_portfolio_company(
+            db,
+            name=company_name,
+            sector_id=sector_id,
+            stage=stage,
+            financials=snapshot.get("financials"),
+            last_round=snapshot.get("last_round"),
+            adjustments=snapshot.get("adjustments"),
+        ).id
+
+    valuation = _add_valuation(
+        db,
+        portfolio_company_id=company_id,
+        company_name=company_name,
+        input_snapshot=input_snapshot,
+        input_hash="",
+        primary_value=primary_value,
+        primary_method=primary_method,
+        value_range_low=value_range_low,
+        value_range_high=value_range_high,
+        overall_confidence=overall_confidence,
+        summary=summary,
+        method_results=method_results,
+        skipped_methods=skipped_methods,
+        config_snapshot=config_snapshot,
+        valuation_date=valuation_date,
+    )
+    # A new company and the valuation go out in the same flush
     await db.flush()
-    await db.refresh(valuation)
     return valuation
 
 
@@ -4,6 +4,7 @@ import os
 from contextlib import asynccontextmanager, contextmanager
 from typing import AsyncGenerator, Generator, Optional
 
+import orjson
 from sqlalchemy import create_engine as create_sync_engine
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -14,6 +15,7 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.config import get_settings
+from src.utils.serialization import json_dumps
 
 
 def _get_raw_database_url() -> str:
@@ -95,7 +97,13 @@ def create_engine() -> AsyncEngine:
         connect_args={
             "timeout": settings.db_connect_timeout,
             "command_timeout": settings.db_command_timeout,
+            # Queries here are short lookups and inserts; JIT compilation
+            # only adds planning latency to them
+            "server_settings": {"jit": "off"},
         },
+        # JSONB columns go through orjson rather than the stdlib json module
+        json_serializer=json_dumps,
+        json_deserializer=orjson.loads,
         # Disable echo in production (set to True for debugging)
         echo=False,
     )
@@ -242,6 +250,8 @@ def _get_sync_session_factory() -> sessionmaker[Session]:
             pool_pre_ping=True,
             pool_size=5,  # Smaller pool for sync operations
             max_overflow=10,
+            json_serializer=json_dumps,
+            json_deserializer=orjson.loads,
         )
         _SyncSessionLocal = sessionmaker(
             bind=sync_engine,
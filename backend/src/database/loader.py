@@ -4,9 +4,11 @@ All runtime data is loaded from the database. JSON files in backend/data/
 are only used during setup (alembic migrations) to seed the database.
 """
 
+import os
+from bisect import bisect_left
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import NamedTuple, Optional
 from uuid import UUID
 
 from src.config import Settings, get_settings
@@ -26,6 +28,40 @@ from src.models import (
 )
 
 
+class _IndexSeries(NamedTuple):
+    """Date-sorted market index series with parallel lookup columns."""
+
+    points: list[MarketIndex]
+    ordinals: list[int]
+    values: list[Decimal]
+    source_name: str
+
+
+# Market index history is static reference data, so each series is read
+# from the database once and shared by every DataLoader reading the same
+# database. Keyed by (database URL, index name).
+_index_series_cache: dict[tuple[str, str], _IndexSeries] = {}
+
+# Comparable sets are seeded reference data as well; keyed by
+# (database URL, sector)
+_comparables_cache: dict[tuple[str, str], ComparableSet] = {}
+
+# Index citations keyed by (database URL, index name), reused until the
+# date rolls over
+_index_source_cache: dict[tuple[str, str], DataSource] = {}
+
+
+def clear_reference_caches() -> None:
+    """Drop the shared market index and comparables caches.
+
+    Call after re-seeding the database (or between tests) so the next
+    DataLoader reads fresh data.
+    """
+    _index_series_cache.clear()
+    _index_source_cache.clear()
+    _comparables_cache.clear()
+
+
 class DataLoader:
     """Loads and caches company, market, and comparable data from the database.
 
@@ -37,7 +73,12 @@ class DataLoader:
         self._settings = settings or get_settings()
         self._indices_cache: Optional[dict[str, list[MarketIndex]]] = None
         self._index_sources: dict[str, str] = {}
-        self._comparables_cache: dict[str, ComparableSet] = {}
+        self._index_ordinals: dict[str, list[int]] = {}
+        self._index_values: dict[str, list[Decimal]] = {}
+        # Scopes this loader's entries in the shared reference caches
+        self._source_key = self._settings.database_url or os.getenv(
+            "DATABASE_URL", ""
+        )
 
     def list_companies(self) -> list[dict[str, str]]:
         """List all available portfolio companies from the database.
@@ -159,25 +200,38 @@ class DataLoader:
         if name in self._indices_cache:
             return
 
-        with get_sync_db() as db:
-            db_indices = crud.get_market_index_time_series_sync(db, name)
+        series = _index_series_cache.get((self._source_key, name))
+        if series is None:
+            with get_sync_db() as db:
+                db_indices = crud.get_market_index_time_series_sync(db, name)
+
+            if not db_indices:
+                return
+
+            points = sorted(
+                [
+                    MarketIndex(
+                        date=idx.date,
+                        value=idx.value,
+                        name=idx.name,
+                        source_name=idx.source_name,
+                    )
+                    for idx in db_indices
+                ],
+                key=lambda p: p.date,
+            )
+            series = _IndexSeries(
+                points=points,
+                ordinals=[p.date.toordinal() for p in points],
+                values=[p.value for p in points],
+                source_name=db_indices[0].source_name,
+            )
+            _index_series_cache[(self._source_key, name)] = series
 
-        if not db_indices:
-            return
-
-        self._index_sources[name] = db_indices[0].source_name
-        self._indices_cache[name] = sorted(
-            [
-                MarketIndex(
-                    date=idx.date,
-                    value=idx.value,
-                    name=idx.name,
-                    source_name=idx.source_name,
-                )
-                for idx in db_indices
-            ],
-            key=lambda p: p.date,
-        )
+        self._index_sources[name] = series.source_name
+        self._indices_cache[name] = series.points
+        self._index_ordinals[name] = series.ordinals
+        self._index_values[name] = series.values
 
     def load_indices(self) -> dict[str, list[MarketIndex]]:
         """Load and cache all known market indices.
@@ -208,22 +262,68 @@ class DataLoader:
 
         return self._indices_cache[name]
 
+    def get_closest_index_value(self, name: str, target_date: date) -> Decimal:
+        """Get the index value on the date closest to a target date.
+
+        Binary-searches cached parallel lists of date ordinals and values
+        built from the date-sorted series. Ties go to the earlier data point.
+
+        Args:
+            name: Index name (e.g., 'NASDAQ', 'SP500').
+            target_date: Date to look up.
+
+        Returns:
+            Value of the closest data point.
+
+        Raises:
+            DataNotFoundError: If index doesn't exist.
+        """
+        ordinals = self._index_ordinals.get(name)
+        values = self._index_values.get(name)
+        if ordinals is None or values is None:
+            points = self.get_index(name)
+            ordinals = [p.date.toordinal() for p in points]
+            values = [p.value for p in points]
+            self._index_ordinals[name] = ordinals
+            self._index_values[name] = values
+
+        target = target_date.toordinal()
+        i = bisect_left(ordinals, target)
+        if i == 0:
+            return values[0]
+        if i == len(ordinals):
+            return values[-1]
+
+        if target - ordinals[i - 1] <= ordinals[i] - target:
+            return values[i - 1]
+        return values[i]
+
     def get_index_source(self, name: str) -> DataSource:
         """Get the data source info for a market index.
 
+        The citation is shared across loaders on the same database and
+        rebuilt once per day. Callers must treat it as read-only.
+
         Args:
             name: Index name.
 
         Returns:
             DataSource with source information.
         """
+        today = date.today()
+        cached = _index_source_cache.get((self._source_key, name))
+        if cached is not None and cached.retrieved_at == today:
+            return cached
+
         self._load_index(name)
 
-        return DataSource(
+        source = DataSource(
             name=self._index_sources.get(name, "Yahoo Finance API"),
-            retrieved_at=date.today(),
+            retrieved_at=today,
             is_mock=True,
         )
+        _index_source_cache[(self._source_key, name)] = source
+        return source
 
     def list_sectors(self) -> list[str]:
         """List all available sectors from the database.
@@ -248,8 +348,9 @@ class DataLoader:
         Raises:
             DataNotFoundError: If no comparables found for sector.
         """
-        if sector in self._comparables_cache:
-            return self._comparables_cache[sector]
+        cached = _comparables_cache.get((self._source_key, sector))
+        if cached is not None:
+            return cached
 
         with get_sync_db() as db:
             db_companies = crud.get_comparables_by_sector_sync(db, sector)
@@ -285,5 +386,5 @@ class DataLoader:
                 is_mock=True,
             ),
         )
-        self._comparables_cache[sector] = comparable_set
+        _comparables_cache[(self._source_key, sector)] = comparable_set
         return comparable_set
@@ -3,7 +3,7 @@
 from datetime import date
 from typing import Any, Optional
 
-from sqlalchemy import Date, ForeignKey, String
+from sqlalchemy import Date, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import ENUM, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -38,3 +38,6 @@ class PortfolioCompany(Base, IdMixin, TimestampMixin):
     adjustments: Mapped[list[dict[str, Any]]] = mapped_column(
         JSONB, nullable=False, default=list
     )
+
+    # Index for get-or-create lookups by name when saving valuations
+    __table_args__ = (Index("ix_portfolio_companies_name", "name"),)
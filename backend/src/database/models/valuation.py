@@ -63,4 +63,11 @@ class Valuation(Base, IdMixin, TimestampMixin):
         Index("ix_valuations_portfolio_company_id", "portfolio_company_id"),
         Index("ix_valuations_input_hash", "input_hash"),
         Index("ix_valuations_created_at", "created_at"),
+        # Serves "latest valuations for company X" without a separate sort
+        Index(
+            "ix_valuations_portco_created_desc",
+            "portfolio_company_id",
+            "created_at",
+            postgresql_ops={"created_at": "DESC"},
+        ),
     )
@@ -1,16 +1,26 @@
 """Centralized logging configuration for production observability."""
 
-import json
 import logging
 from contextvars import ContextVar
 from datetime import datetime
 from typing import Any, Optional
 
+import orjson
+
 from src.config import get_settings
 
 # Context variable for request_id (thread-safe)
 request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
+# Accepted values for the log_level setting, including the stdlib aliases
+# (WARN, FATAL) and NOTSET
+_LEVELS: dict[str, int] = logging.getLevelNamesMapping()
+
+# Attribute count of a LogRecord created without any extra fields
+_BASELINE_ATTR_COUNT = len(
+    logging.LogRecord("", logging.INFO, "", 0, "", None, None).__dict__
+)
+
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logs in production."""
@@ -24,6 +34,17 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string.
         """
+        return self.format_bytes(record).decode()
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Format log record as UTF-8 encoded JSON.
+
+        Args:
+            record: The log record to format.
+
+        Returns:
+            JSON-encoded log line (without trailing newline).
+        """
         log_data: dict[str, Any] = {
             "timestamp": datetime.utcnow().isoformat() + "Z",
             "level": record.levelname,
@@ -40,6 +61,10 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
+        # Plain log calls carry no extras, so skip the attribute scan
+        if len(record.__dict__) == _BASELINE_ATTR_COUNT:
+            return orjson.dumps(log_data)
+
         # Add extra fields from record
         for key, value in record.__dict__.items():
             if key not in [
@@ -67,36 +92,80 @@ class JSONFormatter(logging.Formatter):
             ]:
                 log_data[key] = value
 
-        return json.dumps(log_data)
+        return orjson.dumps(log_data)
 
 
-class TextFormatter(logging.Formatter):
-    """Human-readable formatter for development."""
+class JSONStreamHandler(logging.StreamHandler):
+    """Stream handler that writes JSONFormatter output as raw bytes.
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record as human-readable text.
+    Skips the bytes -> str -> bytes round-trip of the standard StreamHandler
+    by writing orjson output straight to the stream's binary buffer.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the formatted record to the underlying binary buffer.
 
         Args:
-            record: The log record to format.
+            record: The log record to emit.
+        """
+        buffer = getattr(self.stream, "buffer", None)
+        formatter = self.formatter
+        if buffer is None or not isinstance(formatter, JSONFormatter):
+            # Text-only streams (e.g. StringIO) fall back to the str path
+            super().emit(record)
+            return
+
+        try:
+            # Flush any pending text so output stays ordered on shared streams
+            self.stream.flush()
+            buffer.write(formatter.format_bytes(record) + b"\n")
+            buffer.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class RequestIdFilter(logging.Filter):
+    """Attach the current request_id to records for text formatting.
+
+    Sets ``record.request_id_prefix`` instead of rewriting ``record.msg``, so
+    the record stays untouched for any other handlers. The prefix is empty
+    outside a request.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Set ``record.request_id_prefix`` from the current context.
+
+        Args:
+            record: The log record being handled.
 
         Returns:
-            Formatted log string.
+            Always True; records are never dropped.
         """
-        # Add request_id to message if available
         request_id = request_id_var.get()
-        if request_id:
-            record.msg = f"[{request_id}] {record.msg}"
-
-        return super().format(record)
+        record.request_id_prefix = f"[{request_id}] " if request_id else ""
+        return True
 
 
 def setup_logging() -> None:
     """Configure logging based on settings.
 
     Sets up root logger with appropriate formatter and level.
+
+    Raises:
+        ValueError: If the log_level setting is not a known level name.
     """
     settings = get_settings()
 
+    try:
+        log_level = _LEVELS[settings.log_level.upper()]
+    except KeyError:
+        raise ValueError(
+            f"Invalid log_level {settings.log_level!r}; "
+            f"expected one of {', '.join(_LEVELS)}"
+        ) from None
+
     # Get root logger
     root_logger = logging.getLogger()
 
@@ -104,15 +173,17 @@ def setup_logging() -> None:
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
-    # Create console handler
-    console_handler = logging.StreamHandler()
-
-    # Set formatter based on log_format setting
+    # Create console handler and formatter based on log_format setting
+    console_handler: logging.StreamHandler
+    formatter: logging.Formatter
     if settings.log_format == "json":
+        console_handler = JSONStreamHandler()
         formatter = JSONFormatter()
     else:
-        formatter = TextFormatter(
-            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        console_handler = logging.StreamHandler()
+        console_handler.addFilter(RequestIdFilter())
+        formatter = logging.Formatter(
+            fmt="%(asctime)s - %(name)s - %(levelname)s - %(request_id_prefix)s%(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
 
@@ -120,7 +191,6 @@ def setup_logging() -> None:
     root_logger.addHandler(console_handler)
 
     # Set log level
-    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
     root_logger.setLevel(log_level)
 
 
@@ -1,7 +1,8 @@
 """Request logging middleware for production observability."""
 
+import logging
+import secrets
 import time
-import uuid
 from typing import Callable
 
 from fastapi import Request, Response
@@ -27,43 +28,45 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         Returns:
             The HTTP response.
         """
-        # Generate unique request ID
-        request_id = str(uuid.uuid4())
+        # Generate opaque request ID (64 random bits, hex-encoded)
+        request_id = secrets.token_hex(8)
         set_request_id(request_id)
 
-        # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
+        # Skip building log extras entirely when INFO is filtered out
+        info_on = logger.isEnabledFor(logging.INFO)
 
         # Log request start
-        logger.info(
-            "Request started",
-            extra={
-                "method": request.method,
-                "path": request.url.path,
-                "query_params": str(request.query_params),
-                "client_ip": client_ip,
-            },
-        )
-
-        # Process request and measure duration
-        start_time = time.time()
-        try:
-            response = await call_next(request)
-
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
-
-            # Log request completion
+        if info_on:
             logger.info(
-                "Request completed",
+                "Request started",
                 extra={
                     "method": request.method,
                     "path": request.url.path,
-                    "status_code": response.status_code,
-                    "duration_ms": round(duration_ms, 2),
+                    "query_params": str(request.query_params),
+                    "client_ip": request.client.host if request.client else "unknown",
                 },
             )
 
+        # Process request and measure duration (monotonic clock)
+        start_time = time.perf_counter()
+        try:
+            response = await call_next(request)
+
+            # Calculate duration
+            duration_ms = (time.perf_counter() - start_time) * 1000.0
+
+            # Log request completion
+            if info_on:
+                logger.info(
+                    "Request completed",
+                    extra={
+                        "method": request.method,
+                        "path": request.url.path,
+                        "status_code": response.status_code,
+                        "duration_ms": duration_ms,
+                    },
+                )
+
             # Add request ID to response headers
             response.headers["X-Request-ID"] = request_id
 
@@ -71,7 +74,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
         except Exception as e:
             # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000.0
 
             # Log error with full exception details
             logger.error(
@@ -79,7 +82,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                 extra={
                     "method": request.method,
                     "path": request.url.path,
-                    "duration_ms": round(duration_ms, 2),
+                    "duration_ms": duration_ms,
                     "error_type": type(e).__name__,
                     "error_message": str(e),
                 },
@@ -1,10 +1,11 @@
 """Rate limiting middleware using in-memory sliding window."""
 
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import Callable
 
-from fastapi import HTTPException, Request, Response
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from src.config import get_settings
@@ -20,9 +21,13 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             app: The FastAPI application.
         """
         super().__init__(app)
-        # Dict mapping client IP to list of request timestamps
-        self.requests: dict[str, list[float]] = defaultdict(list)
+        # Dict mapping client IP to time.monotonic() request timestamps,
+        # oldest first
+        self.requests: dict[str, deque[float]] = defaultdict(deque)
         self.settings = get_settings()
+        # Idle clients are dropped every _sweep_interval requests
+        self._sweep_counter = 0
+        self._sweep_interval = 1024
 
     async def dispatch(
         self, request: Request, call_next: Callable
@@ -34,10 +39,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             call_next: The next middleware or route handler.
 
         Returns:
-            The HTTP response.
-
-        Raises:
-            HTTPException: 429 if rate limit exceeded.
+            The HTTP response, or a 429 JSON response if rate limit exceeded.
         """
         # Skip rate limiting for health checks
         if request.url.path == "/api/health":
@@ -46,35 +48,54 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # Get client IP
         client_ip = request.client.host if request.client else "unknown"
 
-        # Current timestamp
-        now = time.time()
+        # Monotonic clock, so the window cannot be skewed by wall-clock
+        # adjustments and the history stays ordered
+        now = time.monotonic()
 
         # Get client's request history
         client_requests = self.requests[client_ip]
 
         # Remove requests outside the current window
         window_start = now - self.settings.rate_limit_window_seconds
-        client_requests[:] = [ts for ts in client_requests if ts > window_start]
+        # Timestamps are appended in order, so expired ones form a prefix
+        while client_requests and client_requests[0] <= window_start:
+            client_requests.popleft()
 
         # Check if limit exceeded
         if len(client_requests) >= self.settings.rate_limit_requests:
-            # Calculate when the oldest request will expire
+            # Calculate when the oldest request will expire, as a Unix time
             oldest_request = client_requests[0]
-            reset_time = int(oldest_request + self.settings.rate_limit_window_seconds)
+            reset_time = int(
+                time.time()
+                + oldest_request
+                + self.settings.rate_limit_window_seconds
+                - now
+            )
 
-            raise HTTPException(
+            # Exceptions raised here would bypass FastAPI's handlers and
+            # reach the client as a 500, so build the response directly
+            return JSONResponse(
                 status_code=429,
-                detail={
-                    "error": "Rate limit exceeded",
-                    "limit": self.settings.rate_limit_requests,
-                    "window_seconds": self.settings.rate_limit_window_seconds,
-                    "reset_at": reset_time,
+                content={
+                    "detail": {
+                        "error": "Rate limit exceeded",
+                        "limit": self.settings.rate_limit_requests,
+                        "window_seconds": self.settings.rate_limit_window_seconds,
+                        "reset_at": reset_time,
+                    }
                 },
             )
 
         # Add current request to history
         client_requests.append(now)
 
+        # Periodically drop idle clients; done after appending so the
+        # current client's history is never swept away
+        self._sweep_counter += 1
+        if self._sweep_counter >= self._sweep_interval:
+            self._sweep_counter = 0
+            self._sweep_idle_clients(window_start)
+
         # Process request
         response = await call_next(request)
 
@@ -84,7 +105,17 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             self.settings.rate_limit_requests - len(client_requests)
         )
         response.headers["X-RateLimit-Reset"] = str(
-            int(now + self.settings.rate_limit_window_seconds)
+            int(time.time() + self.settings.rate_limit_window_seconds)
         )
 
         return response
+
+    def _sweep_idle_clients(self, window_start: float) -> None:
+        """Forget clients with no requests inside the current window.
+
+        Args:
+            window_start: Timestamps at or before this are expired.
+        """
+        for ip, timestamps in list(self.requests.items()):
+            if not timestamps or timestamps[-1] <= window_start:
+                del self.requests[ip]
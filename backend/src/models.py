@@ -3,10 +3,18 @@
 from datetime import date
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Any, Optional
 from typing_extensions import Self
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    ValidatorFunctionWrapHandler,
+    field_validator,
+    model_validator,
+)
 
 
 # ============================================================================
@@ -39,6 +47,19 @@ class Confidence(str, Enum):
 # Company Models
 # ============================================================================
 
+def _bound_error(exc: ValidationError) -> str | None:
+    """Return the type of the first numeric bound error in exc, if any.
+
+    Field constraints are checked natively, but their default messages
+    differ from the ones the API has always returned, so the wrap
+    validators below translate bound failures back to those messages.
+    """
+    for error in exc.errors():
+        if error["type"] in ("greater_than", "greater_than_equal", "less_than_equal"):
+            return error["type"]
+    return None
+
+
 class Company(BaseModel):
     """Basic company information."""
     id: str
@@ -50,57 +71,71 @@ class Company(BaseModel):
 
 class Financials(BaseModel):
     """Company financial metrics."""
+    # Numeric bounds use Field constraints, which pydantic-core checks natively
     revenue_ttm: Optional[Decimal] = Field(
         default=None,
+        ge=0,
         description="Trailing twelve months revenue"
     )
     revenue_growth_yoy: Optional[Decimal] = Field(
         default=None,
         description="Year-over-year revenue growth rate"
     )
-    gross_margin: Optional[Decimal] = None
-    burn_rate: Optional[Decimal] = None
+    gross_margin: Optional[Decimal] = Field(default=None, ge=0, le=1)
+    burn_rate: Optional[Decimal] = Field(default=None, ge=0)
     runway_months: Optional[int] = None
 
-    @field_validator("revenue_ttm", "burn_rate")
+    @field_validator("revenue_ttm", "burn_rate", mode="wrap")
     @classmethod
-    def validate_positive(cls, v: Decimal | None) -> Decimal | None:
+    def validate_positive(cls, v: Any, handler: ValidatorFunctionWrapHandler) -> Decimal | None:
         """Validate that revenue_ttm and burn_rate are positive."""
-        if v is not None and v < 0:
-            raise ValueError("Must be positive")
-        return v
-
-    @field_validator("gross_margin")
+        try:
+            return handler(v)
+        except ValidationError as exc:
+            if _bound_error(exc):
+                raise ValueError("Must be positive") from None
+            raise
+
+    @field_validator("gross_margin", mode="wrap")
     @classmethod
-    def validate_margin(cls, v: Decimal | None) -> Decimal | None:
+    def validate_margin(cls, v: Any, handler: ValidatorFunctionWrapHandler) -> Decimal | None:
         """Validate that gross_margin is between 0 and 1."""
-        if v is not None and not (0 <= v <= 1):
-            raise ValueError("Gross margin must be between 0 and 1")
-        return v
+        try:
+            return handler(v)
+        except ValidationError as exc:
+            if _bound_error(exc):
+                raise ValueError("Gross margin must be between 0 and 1") from None
+            raise
+
+
+# Rounding slack allowed between post-money and pre-money + amount raised
+_POST_MONEY_TOLERANCE = Decimal("0.01")
 
 
 class LastRound(BaseModel):
     """Last funding round details."""
     date: date
-    valuation_pre: Decimal = Field(description="Pre-money valuation")
-    valuation_post: Decimal = Field(description="Post-money valuation")
-    amount_raised: Decimal
+    valuation_pre: Decimal = Field(gt=0, description="Pre-money valuation")
+    valuation_post: Decimal = Field(gt=0, description="Post-money valuation")
+    amount_raised: Decimal = Field(gt=0)
     lead_investor: Optional[str] = None
 
-    @field_validator("valuation_pre", "valuation_post", "amount_raised")
+    @field_validator("valuation_pre", "valuation_post", "amount_raised", mode="wrap")
     @classmethod
-    def validate_positive(cls, v: Decimal) -> Decimal:
+    def validate_positive(cls, v: Any, handler: ValidatorFunctionWrapHandler) -> Decimal:
         """Validate that valuations and amount raised are positive."""
-        if v <= 0:
-            raise ValueError("Must be positive")
-        return v
+        try:
+            return handler(v)
+        except ValidationError as exc:
+            if _bound_error(exc):
+                raise ValueError("Must be positive") from None
+            raise
 
     @field_validator("date")
     @classmethod
     def validate_date(cls, v: date) -> date:
         """Validate that funding round date is not in the future."""
-        from datetime import date as date_cls
-        if v > date_cls.today():
+        if v > date.today():
             raise ValueError("Funding round date cannot be in the future")
         return v
 
@@ -108,7 +143,7 @@ class LastRound(BaseModel):
     def validate_post_money(self) -> Self:
         """Validate that post-money equals pre-money plus amount raised."""
         expected_post = self.valuation_pre + self.amount_raised
-        if abs(self.valuation_post - expected_post) > Decimal("0.01"):
+        if abs(self.valuation_post - expected_post) > _POST_MONEY_TOLERANCE:
             raise ValueError("Post-money must equal pre-money + amount raised")
         return self
 
@@ -116,18 +151,22 @@ class LastRound(BaseModel):
 class Adjustment(BaseModel):
     """Company-specific valuation adjustment."""
     name: str
-    factor: Decimal = Field(description="Multiplier (1.0 = no change)")
+    factor: Decimal = Field(gt=0, le=10, description="Multiplier (1.0 = no change)")
     reason: str
 
-    @field_validator("factor")
+    @field_validator("factor", mode="wrap")
     @classmethod
-    def validate_factor(cls, v: Decimal) -> Decimal:
+    def validate_factor(cls, v: Any, handler: ValidatorFunctionWrapHandler) -> Decimal:
         """Validate that adjustment factor is positive and reasonable."""
-        if v <= 0:
-            raise ValueError("Adjustment factor must be positive")
-        if v > 10:
-            raise ValueError("Adjustment factor seems unreasonably high (>10x)")
-        return v
+        try:
+            return handler(v)
+        except ValidationError as exc:
+            bound = _bound_error(exc)
+            if bound == "greater_than":
+                raise ValueError("Adjustment factor must be positive") from None
+            if bound == "less_than_equal":
+                raise ValueError("Adjustment factor seems unreasonably high (>10x)") from None
+            raise
 
 
 class CompanyData(BaseModel):
@@ -183,8 +222,14 @@ class ComparableSet(BaseModel):
 # Result Models
 # ============================================================================
 
+# Results are built once by the engine and only read afterwards
+_RESULT_CONFIG = ConfigDict(frozen=True, extra="forbid")
+
+
 class AuditStep(BaseModel):
     """Single step in the audit trail."""
+    model_config = _RESULT_CONFIG
+
     step_number: int
     description: str
     inputs: dict = Field(default_factory=dict)
@@ -194,6 +239,8 @@ class AuditStep(BaseModel):
 
 class MethodResult(BaseModel):
     """Result from a single valuation method."""
+    model_config = _RESULT_CONFIG
+
     method: MethodName
     value: Decimal
     confidence: Confidence
@@ -207,12 +254,16 @@ class MethodResult(BaseModel):
 
 class MethodSkipped(BaseModel):
     """Record of a skipped valuation method."""
+    model_config = _RESULT_CONFIG
+
     method: MethodName
     reason: str
 
 
 class MethodComparisonItem(BaseModel):
     """Single method in the comparison summary."""
+    model_config = _RESULT_CONFIG
+
     method: MethodName
     value: Decimal
     confidence: Confidence
@@ -221,6 +272,8 @@ class MethodComparisonItem(BaseModel):
 
 class MethodComparisonData(BaseModel):
     """Structured comparison data for all methods."""
+    model_config = _RESULT_CONFIG
+
     methods: list[MethodComparisonItem]
     spread_percent: Optional[Decimal] = Field(
         default=None,
@@ -238,6 +291,8 @@ class MethodComparisonData(BaseModel):
 
 class ValuationSummary(BaseModel):
     """Executive summary of valuation."""
+    model_config = _RESULT_CONFIG
+
     primary_value: Decimal
     primary_method: MethodName
     value_range_low: Optional[Decimal] = None
@@ -260,6 +315,8 @@ class ValuationSummary(BaseModel):
 
 class ValuationResult(BaseModel):
     """Complete valuation result with full audit trail."""
+    model_config = _RESULT_CONFIG
+
     company_id: str
     company_name: str
     valuation_date: date
@@ -1,6 +1,5 @@
 """Portfolio company service for business logic."""
 
-import random
 from typing import Optional
 
 from src.database import crud
@@ -20,9 +19,4 @@ class PortfolioCompanyService:
             Random PortfolioCompany or None if no companies exist.
         """
         async with get_db_context() as db:
-            companies = await crud.list_portfolio_companies(db, limit=100)
-
-            if not companies:
-                return None
-
-            return random.choice(companies)
+            return await crud.get_random_portfolio_company(db)
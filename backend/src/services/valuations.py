@@ -1,6 +1,5 @@
 """Valuation service for orchestrating valuation runs and database persistence."""
 
-from decimal import Decimal
 from typing import Any
 from uuid import UUID
 
@@ -8,7 +7,7 @@ from src.database import crud
 from src.database.database import get_db_context
 from src.valuation.engine import ValuationEngine
 from src.models import CompanyData, ValuationResult
-from src.utils.serialization import make_json_serializable
+from src.utils.serialization import RawJSON, make_json_serializable
 
 
 def _convert_method_results(result: ValuationResult) -> list[dict[str, Any]]:
@@ -90,7 +89,8 @@ def _convert_summary(result: ValuationResult) -> dict[str, Any]:
 def convert_result_for_response(result: ValuationResult) -> dict[str, Any]:
     """Convert ValuationResult to API response format.
 
-    Used by routes.py to format the response for /valuations/run-and-save.
+    The same payload is stored in the database and returned by
+    /valuations/run-and-save, so it is built once per valuation.
     """
     return {
         "method_results": _convert_method_results(result),
@@ -117,20 +117,21 @@ class ValuationService:
 
     async def run_and_save_valuation(
         self, company_data: CompanyData
-    ) -> tuple[ValuationResult, UUID]:
+    ) -> tuple[ValuationResult, UUID, dict[str, Any]]:
         """Run valuation engine and persist to database.
 
         This method:
         1. Runs the valuation engine with the provided company data
         2. Gets or creates a portfolio company record
         3. Saves the valuation result to the database
-        4. Returns both the result and the saved valuation ID
+        4. Returns the result, the saved valuation ID and the serialized
+           payload (shared by the database row and the API response)
 
         Args:
             company_data: The company data to value.
 
         Returns:
-            Tuple of (ValuationResult, saved_valuation_id).
+            Tuple of (ValuationResult, saved_valuation_id, serialized payload).
 
         Raises:
             NoValidMethodsError: If no valuation methods can be executed.
@@ -139,60 +140,26 @@ class ValuationService:
         # Step 1: Run the valuation engine (pure business logic, no DB)
         result = self.engine.run_with_data(company_data)
 
-        # Step 2 & 3: Save to database
-        async with get_db_context() as db:
-            # Get or create portfolio company
-            # First, try to find existing company by name
-            companies = await crud.list_portfolio_companies(db, limit=100)
-            portfolio_company = next(
-                (c for c in companies if c.name == company_data.company.name), None
-            )
+        # Serialize the input straight to JSON; it is only parsed back into
+        # a dict if a new company record has to be seeded from it
+        input_snapshot = RawJSON(company_data.model_dump_json())
 
-            if portfolio_company is None:
-                # Create a new portfolio company
-                portfolio_company = await crud.create_portfolio_company(
-                    db=db,
-                    name=company_data.company.name,
-                    sector_id=company_data.company.sector,
-                    stage=company_data.company.stage.value,
-                    founded_date=None,
-                    financials=(
-                        company_data.financials.model_dump(mode="json")
-                        if company_data.financials
-                        else {}
-                    ),
-                    last_round=(
-                        company_data.last_round.model_dump(mode="json")
-                        if company_data.last_round
-                        else None
-                    ),
-                    adjustments=[
-                        a.model_dump(mode="json") for a in company_data.adjustments
-                    ],
-                )
-
-            # Convert valuation result to database format
-            db_data = convert_result_for_response(result)
-
-            # Save the valuation
-            saved_valuation = await crud.create_valuation(
+        # Convert valuation result to database format
+        db_data = convert_result_for_response(result)
+
+        # Step 2 & 3: Get or create the portfolio company and save the
+        # valuation in one transaction
+        async with get_db_context() as db:
+            saved_valuation = await crud.create_valuation_for_company(
                 db=db,
-                portfolio_company_id=portfolio_company.id,
-                company_name=result.company_name,
-                input_snapshot=company_data.model_dump(mode="json"),
-                input_hash="",  # Hash removed from application logic
-                primary_value=Decimal(str(result.summary.primary_value)),
+                company_name=company_data.company.name,
+                sector_id=company_data.company.sector,
+                stage=company_data.company.stage.value,
+                input_snapshot=input_snapshot,
+                primary_value=result.summary.primary_value,
                 primary_method=result.summary.primary_method.value,
-                value_range_low=(
-                    Decimal(str(result.summary.value_range_low))
-                    if result.summary.value_range_low
-                    else None
-                ),
-                value_range_high=(
-                    Decimal(str(result.summary.value_range_high))
-                    if result.summary.value_range_high
-                    else None
-                ),
+                value_range_low=result.summary.value_range_low,
+                value_range_high=result.summary.value_range_high,
                 overall_confidence=result.summary.overall_confidence.value,
                 summary=db_data["summary"],
                 method_results=db_data["method_results"],
@@ -200,4 +167,4 @@ class ValuationService:
                 config_snapshot=db_data["config_snapshot"],
             )
 
-            return result, saved_valuation.id
+            return result, saved_valuation.id, db_data
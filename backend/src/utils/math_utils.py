@@ -1,14 +1,25 @@
 """Mathematical utility functions for valuation calculations."""
 
 from decimal import Decimal, ROUND_HALF_UP
+from functools import lru_cache
 from typing import Sequence
 
+# (threshold, power-of-ten shift, suffix) for format_currency, largest first
+_CURRENCY_SCALES: tuple[tuple[Decimal, int, str], ...] = (
+    (Decimal("1000000000"), -9, "B"),
+    (Decimal("1000000"), -6, "M"),
+    (Decimal("1000"), -3, "K"),
+)
+_CENTS = Decimal("0.01")
 
-def median(values: Sequence[Decimal]) -> Decimal:
+
+def median(values: Sequence[Decimal], presorted: bool = False) -> Decimal:
     """Calculate median of a sequence of Decimal values.
 
     Args:
         values: Sequence of Decimal values.
+        presorted: True if values are already in ascending order, which
+            skips the sort.
 
     Returns:
         Median value.
@@ -19,7 +30,7 @@ def median(values: Sequence[Decimal]) -> Decimal:
     if not values:
         raise ValueError("Cannot calculate median of empty sequence")
 
-    sorted_values = sorted(values)
+    sorted_values = values if presorted else sorted(values)
     n = len(sorted_values)
     mid = n // 2
 
@@ -48,22 +59,60 @@ def percentile(values: Sequence[Decimal], p: int) -> Decimal:
     if not 0 <= p <= 100:
         raise ValueError(f"Percentile must be between 0 and 100, got {p}")
 
-    sorted_values = sorted(values)
+    return _interpolate(sorted(values), p)
+
+
+def percentiles(
+    values: Sequence[Decimal], ps: Sequence[int], presorted: bool = False
+) -> list[Decimal]:
+    """Calculate several percentiles of a sequence with a single sort.
+
+    Uses the same linear interpolation as ``percentile``.
+
+    Args:
+        values: Sequence of Decimal values.
+        ps: Percentiles to calculate (each 0-100).
+        presorted: True if values are already in ascending order, which
+            skips the sort.
+
+    Returns:
+        Percentile values, in the same order as ``ps``.
+
+    Raises:
+        ValueError: If sequence is empty or any percentile is invalid.
+    """
+    if not values:
+        raise ValueError("Cannot calculate percentile of empty sequence")
+    for p in ps:
+        if not 0 <= p <= 100:
+            raise ValueError(f"Percentile must be between 0 and 100, got {p}")
+
+    sorted_values = values if presorted else sorted(values)
+    return [_interpolate(sorted_values, p) for p in ps]
+
+
+def _interpolate(sorted_values: Sequence[Decimal], p: int) -> Decimal:
+    """Interpolate the p-th percentile of already-sorted values."""
     n = len(sorted_values)
 
     if n == 1:
         return sorted_values[0]
 
-    # Calculate rank
-    rank = (p / 100) * (n - 1)
-    lower_idx = int(rank)
-    upper_idx = min(lower_idx + 1, n - 1)
-    fraction = Decimal(str(rank - lower_idx))
-
+    # Rank is p * (n - 1) / 100; keep it as integers so the fraction is
+    # exact and never goes through float -> str -> Decimal
+    lower_idx, remainder = divmod(p * (n - 1), 100)
     lower_val = sorted_values[lower_idx]
-    upper_val = sorted_values[upper_idx]
+    if remainder == 0:
+        return lower_val
+
+    upper_val = sorted_values[lower_idx + 1]
+    return lower_val + Decimal(remainder) / 100 * (upper_val - lower_val)
+
 
-    return lower_val + fraction * (upper_val - lower_val)
+@lru_cache(maxsize=None)
+def _quantizer(places: int) -> Decimal:
+    """Get the Decimal exponent template for rounding to ``places`` places."""
+    return Decimal(1).scaleb(-places) if places > 0 else Decimal(1)
 
 
 def round_decimal(value: Decimal, places: int = 2) -> Decimal:
@@ -76,8 +125,7 @@ def round_decimal(value: Decimal, places: int = 2) -> Decimal:
     Returns:
         Rounded Decimal value.
     """
-    quantize_str = "0." + "0" * places if places > 0 else "0"
-    return value.quantize(Decimal(quantize_str), rounding=ROUND_HALF_UP)
+    return value.quantize(_quantizer(places), rounding=ROUND_HALF_UP)
 
 
 def format_currency(value: Decimal, symbol: str = "$") -> str:
@@ -90,10 +138,10 @@ def format_currency(value: Decimal, symbol: str = "$") -> str:
     Returns:
         Formatted currency string.
     """
-    if value >= 1_000_000_000:
-        return f"{symbol}{round_decimal(value / 1_000_000_000, 2)}B"
-    if value >= 1_000_000:
-        return f"{symbol}{round_decimal(value / 1_000_000, 2)}M"
-    if value >= 1_000:
-        return f"{symbol}{round_decimal(value / 1_000, 2)}K"
-    return f"{symbol}{round_decimal(value, 2)}"
+    # Precomputed thresholds, and scaleb only shifts the exponent, so no
+    # Decimal construction or division happens per call
+    for threshold, shift, suffix in _CURRENCY_SCALES:
+        if value >= threshold:
+            scaled = value.scaleb(shift).quantize(_CENTS, rounding=ROUND_HALF_UP)
+            return f"{symbol}{scaled}{suffix}"
+    return f"{symbol}{value.quantize(_CENTS, rounding=ROUND_HALF_UP)}"
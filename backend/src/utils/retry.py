@@ -2,6 +2,7 @@
 
 import asyncio
 import functools
+import random
 import time
 from typing import Any, Callable, Type, TypeVar
 
@@ -13,33 +14,129 @@ logger = get_logger(__name__)
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+def _resolve_params(
+    max_attempts: int | None,
+    base_delay: float | None,
+    max_delay: float | None,
+) -> tuple[int, tuple[float, ...]]:
+    """Fill in unset retry parameters from settings.
+
+    Returns:
+        Tuple of (attempts, wait before each retry). The wait schedule has
+        one entry per attempt that can be followed by another.
+    """
+    settings = get_settings()
+    attempts = max_attempts or settings.retry_max_attempts
+    delay = base_delay or settings.retry_base_delay
+    max_d = max_delay or settings.retry_max_delay
+    schedule = tuple(min(delay * (1 << i), max_d) for i in range(attempts - 1))
+    return attempts, schedule
+
+
+def _fresh_copy(exc: Exception) -> Exception:
+    """Copy an exception without its traceback, cause or context.
+
+    Bypasses ``__init__`` so exceptions with extra constructor arguments
+    (e.g. SQLAlchemy's DBAPIError) copy too.
+    """
+    fresh = type(exc).__new__(type(exc), *exc.args)
+    fresh.__dict__.update(exc.__dict__)
+    return fresh
+
+
+class _FailCache:
+    """Exhausted failures remembered per call arguments for a fixed TTL.
+
+    Only failures that used up every retry are recorded. Each hit raises a
+    fresh copy of the stored exception, so callers never share (or extend
+    the traceback of) one instance. Calls with unhashable arguments are
+    never cached.
+    """
+
+    __slots__ = ("ttl", "_failures")
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._failures: dict[Any, tuple[Exception, float]] = {}
+
+    @staticmethod
+    def key(args: tuple, kwargs: dict[str, Any]) -> Any:
+        """Build the cache key for a call, or None if it cannot be hashed."""
+        key = (args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def check(self, key: Any) -> None:
+        """Raise a copy of the cached failure for key, if one is still live."""
+        if key is None:
+            return
+        entry = self._failures.get(key)
+        if entry is None:
+            return
+        failure, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._failures[key]
+            return
+        raise _fresh_copy(failure)
+
+    def record(self, key: Any, failure: Exception) -> None:
+        """Remember an exhausted failure for key, dropping expired entries."""
+        if key is None:
+            return
+        now = time.monotonic()
+        for stale in [k for k, (_, exp) in self._failures.items() if exp <= now]:
+            del self._failures[stale]
+        # Store a detached copy; the caller still raises the original with
+        # its traceback
+        self._failures[key] = (_fresh_copy(failure), now + self.ttl)
+
+
 def retry_on_exception(
     exceptions: tuple[Type[Exception], ...],
     max_attempts: int | None = None,
     base_delay: float | None = None,
     max_delay: float | None = None,
+    jitter: bool = False,
+    fail_cache_ttl: float | None = None,
 ) -> Callable[[F], F]:
     """Decorator to retry a synchronous function on specific exceptions.
 
-    Uses exponential backoff: delay = base_delay * (2 ** attempt).
+    Uses exponential backoff: delay = base_delay * (2 ** attempt), capped at
+    max_delay. With jitter, each wait is drawn uniformly from [0, delay] so
+    concurrent callers do not retry in lockstep.
 
     Args:
         exceptions: Tuple of exception types to retry on.
         max_attempts: Maximum number of retry attempts (from config if None).
         base_delay: Initial delay in seconds (from config if None).
         max_delay: Maximum delay cap in seconds (from config if None).
+        jitter: Randomize each wait within its backoff window (full jitter).
+        fail_cache_ttl: If set, once a call exhausts its attempts, further
+            calls with the same (hashable) arguments re-raise that failure
+            for this many seconds without calling the function.
 
     Returns:
         Decorated function with retry logic.
     """
 
     def decorator(func: F) -> F:
+        # Resolved from settings on the first call, then reused
+        params: tuple[int, tuple[float, ...]] | None = None
+        fail_cache = _FailCache(fail_cache_ttl) if fail_cache_ttl else None
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            settings = get_settings()
-            attempts = max_attempts or settings.retry_max_attempts
-            delay = base_delay or settings.retry_base_delay
-            max_d = max_delay or settings.retry_max_delay
+            nonlocal params
+            cache_key = None
+            if fail_cache is not None:
+                cache_key = fail_cache.key(args, kwargs)
+                fail_cache.check(cache_key)
+            if params is None:
+                params = _resolve_params(max_attempts, base_delay, max_delay)
+            attempts, schedule = params
 
             last_exception = None
             for attempt in range(attempts):
@@ -48,7 +145,9 @@ def retry_on_exception(
                 except exceptions as e:
                     last_exception = e
                     if attempt < attempts - 1:  # Don't sleep on last attempt
-                        wait_time = min(delay * (2**attempt), max_d)
+                        wait_time = schedule[attempt]
+                        if jitter:
+                            wait_time = random.uniform(0, wait_time)
                         logger.warning(
                             f"Retry attempt {attempt + 1}/{attempts} for {func.__name__} "
                             f"after {type(e).__name__}: {str(e)}. "
@@ -62,6 +161,8 @@ def retry_on_exception(
 
             # Raise the last exception if all attempts failed
             if last_exception:
+                if fail_cache is not None:
+                    fail_cache.record(cache_key, last_exception)
                 raise last_exception
 
             # This should never happen, but satisfy type checker
@@ -77,28 +178,44 @@ def async_retry_on_exception(
     max_attempts: int | None = None,
     base_delay: float | None = None,
     max_delay: float | None = None,
+    jitter: bool = False,
+    fail_cache_ttl: float | None = None,
 ) -> Callable[[F], F]:
     """Decorator to retry an async function on specific exceptions.
 
-    Uses exponential backoff: delay = base_delay * (2 ** attempt).
+    Uses exponential backoff: delay = base_delay * (2 ** attempt), capped at
+    max_delay. With jitter, each wait is drawn uniformly from [0, delay] so
+    concurrent callers do not retry in lockstep.
 
     Args:
         exceptions: Tuple of exception types to retry on.
         max_attempts: Maximum number of retry attempts (from config if None).
         base_delay: Initial delay in seconds (from config if None).
         max_delay: Maximum delay cap in seconds (from config if None).
+        jitter: Randomize each wait within its backoff window (full jitter).
+        fail_cache_ttl: If set, once a call exhausts its attempts, further
+            calls with the same (hashable) arguments re-raise that failure
+            for this many seconds without calling the function.
 
     Returns:
         Decorated async function with retry logic.
     """
 
     def decorator(func: F) -> F:
+        # Resolved from settings on the first call, then reused
+        params: tuple[int, tuple[float, ...]] | None = None
+        fail_cache = _FailCache(fail_cache_ttl) if fail_cache_ttl else None
+
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            settings = get_settings()
-            attempts = max_attempts or settings.retry_max_attempts
-            delay = base_delay or settings.retry_base_delay
-            max_d = max_delay or settings.retry_max_delay
+            nonlocal params
+            cache_key = None
+            if fail_cache is not None:
+                cache_key = fail_cache.key(args, kwargs)
+                fail_cache.check(cache_key)
+            if params is None:
+                params = _resolve_params(max_attempts, base_delay, max_delay)
+            attempts, schedule = params
 
             last_exception = None
             for attempt in range(attempts):
@@ -107,7 +224,9 @@ def async_retry_on_exception(
                 except exceptions as e:
                     last_exception = e
                     if attempt < attempts - 1:  # Don't sleep on last attempt
-                        wait_time = min(delay * (2**attempt), max_d)
+                        wait_time = schedule[attempt]
+                        if jitter:
+                            wait_time = random.uniform(0, wait_time)
                         logger.warning(
                             f"Retry attempt {attempt + 1}/{attempts} for {func.__name__} "
                             f"after {type(e).__name__}: {str(e)}. "
@@ -121,6 +240,8 @@ def async_retry_on_exception(
 
             # Raise the last exception if all attempts failed
             if last_exception:
+                if fail_cache is not None:
+                    fail_cache.record(cache_key, last_exception)
                 raise last_exception
 
             # This should never happen, but satisfy type checker
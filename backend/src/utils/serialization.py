@@ -3,23 +3,82 @@
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any
+from typing import Any, Callable
 from uuid import UUID
 
+import orjson
 
-def make_json_serializable(obj: Any) -> Any:
-    """Convert object to JSON-serializable format.
+# Scalar types JSON encodes natively
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
 
-    Handles: Decimal, date, datetime, UUID, Enum, dict, list, Pydantic models.
 
-    Args:
-        obj: The object to convert.
+class RawJSON(str):
+    """A string that already holds serialized JSON.
 
-    Returns:
-        JSON-serializable representation of the object.
+    ``json_dumps`` writes it out verbatim instead of encoding it as a JSON
+    string, so a payload serialized elsewhere (e.g. by ``model_dump_json``)
+    can be bound to a JSON column without a round trip through a dict.
+    """
+
+
+def _is_json_native(obj: dict | list) -> bool:
+    """Check whether a container holds only dicts, lists and JSON scalars.
+
+    Walks the tree iteratively and stops at the first node that would need
+    converting.
     """
-    if obj is None:
-        return None
+    stack: list[Any] = [obj]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is dict:
+            stack.extend(node.values())
+        elif node_type is list:
+            stack.extend(node)
+        elif node_type not in _JSON_SCALAR_TYPES:
+            return False
+    return True
+
+
+def _identity(obj: Any) -> Any:
+    """Return a JSON-native value unchanged."""
+    return obj
+
+
+def _encode_dict(obj: dict) -> dict:
+    """Convert each value of a dict."""
+    return {k: _convert(v) for k, v in obj.items()}
+
+
+def _encode_list(obj: list | tuple) -> list:
+    """Convert each item of a list or tuple."""
+    return [_convert(item) for item in obj]
+
+
+# Encoders keyed by exact type, covering the shapes that dominate audit
+# payloads. Subclasses (e.g. str enums) miss here and take the isinstance path.
+_ENCODERS: dict[type, Callable[[Any], Any]] = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+    dict: _encode_dict,
+    list: _encode_list,
+    tuple: _encode_list,
+    Decimal: str,
+    date: date.isoformat,
+    datetime: datetime.isoformat,
+    UUID: str,
+}
+
+
+def _convert(obj: Any) -> Any:
+    """Convert one value, recursing into containers without re-checking them."""
+    encoder = _ENCODERS.get(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+
     if isinstance(obj, (str, int, float, bool)):
         return obj
     if isinstance(obj, Decimal):
@@ -31,10 +90,50 @@ def make_json_serializable(obj: Any) -> Any:
     if isinstance(obj, Enum):
         return obj.value
     if isinstance(obj, dict):
-        return {k: make_json_serializable(v) for k, v in obj.items()}
+        return _encode_dict(obj)
     if isinstance(obj, (list, tuple)):
-        return [make_json_serializable(item) for item in obj]
+        return _encode_list(obj)
     if hasattr(obj, "model_dump"):
-        return make_json_serializable(obj.model_dump())
+        return _convert(obj.model_dump())
     # Fallback: convert to string
     return str(obj)
+
+
+def make_json_serializable(obj: Any) -> Any:
+    """Convert object to JSON-serializable format.
+
+    Handles: Decimal, date, datetime, UUID, Enum, dict, list, Pydantic models.
+    A dict or list that already holds only JSON values is returned as-is;
+    the tree is checked once here, not at every nesting level.
+
+    Args:
+        obj: The object to convert.
+
+    Returns:
+        JSON-serializable representation of the object.
+    """
+    if type(obj) in (dict, list) and _is_json_native(obj):
+        return obj
+    return _convert(obj)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string with orjson.
+
+    Used as the database engines' JSON serializer. orjson handles dates,
+    UUIDs, enums and containers natively; anything else (Decimal, Pydantic
+    models) goes through ``make_json_serializable``. ``RawJSON`` values are
+    returned as-is.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        JSON string.
+    """
+    if type(obj) is RawJSON:
+        # Hand drivers a plain str; some reject str subclasses
+        return str(obj)
+    return orjson.dumps(
+        obj, default=make_json_serializable, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
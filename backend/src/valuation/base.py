@@ -1,10 +1,10 @@
 """Base classes for valuation methods."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional, Type
+from decimal import Context, Decimal, localcontext
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, Optional, Type
 
-from src.config import ValuationConfig
-from src.database.loader import DataLoader
 from src.models import (
     AuditStep,
     CompanyData,
@@ -13,6 +13,20 @@ from src.models import (
     MethodResult,
     MethodSkipped,
 )
+from src.utils.math_utils import format_currency, round_decimal
+
+if TYPE_CHECKING:
+    # Annotation-only imports; keeps the loader/DB stack off the import path
+    from src.config import ValuationConfig
+    from src.database.loader import DataLoader
+
+# Decimal context for method arithmetic: default 28-digit precision and
+# rounding, so valuations stay exact to the dollar at any realistic size.
+# Display rounding goes through round_decimal, not this context.
+_VALUATION_CTX = Context(prec=28)
+
+# Neutral starting factor for company-specific adjustments
+_NO_ADJUSTMENT = Decimal("1.0")
 
 
 class ValuationMethod(ABC):
@@ -25,18 +39,32 @@ class ValuationMethod(ABC):
 
     method_name: MethodName
 
+    # Methods are created per valuation; slots keep instances dict-free.
+    # Subclasses declare their own __slots__ for any extra state.
+    __slots__ = (
+        "company_data",
+        "config",
+        "loader",
+        "_audit_steps",
+        "_trail",
+        "_warnings",
+    )
+
     def __init__(
         self,
         company_data: CompanyData,
-        config: ValuationConfig,
-        loader: DataLoader,
+        config: "ValuationConfig",
+        loader: "DataLoader",
     ):
         self.company_data = company_data
         self.config = config
         self.loader = loader
         self._audit_steps: list[AuditStep] = []
-        self._step_counter = 0
-        self._warnings: list[str] = []
+        # When False, _add_step is a no-op and methods may skip building
+        # step-only inputs
+        self._trail = config.include_audit_trail
+        # Insertion-ordered set: repeated warnings are reported once
+        self._warnings: dict[str, None] = {}
 
     def _add_step(
         self,
@@ -53,10 +81,14 @@ class ValuationMethod(ABC):
             calculation: Formula or calculation performed.
             result: Result of the calculation.
         """
-        self._step_counter += 1
-        self._audit_steps.append(
-            AuditStep(
-                step_number=self._step_counter,
+        if not self._trail:
+            return
+        steps = self._audit_steps
+        # Steps are built from trusted internal values; skip validation.
+        # Step numbers are 1-based positions in the trail.
+        steps.append(
+            AuditStep.model_construct(
+                step_number=len(steps) + 1,
                 description=description,
                 inputs=inputs or {},
                 calculation=calculation,
@@ -65,16 +97,16 @@ class ValuationMethod(ABC):
         )
 
     def _add_warning(self, warning: str) -> None:
-        """Add a warning to the result.
+        """Add a warning to the result, ignoring exact duplicates.
 
         Args:
             warning: Warning message.
         """
-        self._warnings.append(warning)
+        self._warnings[warning] = None
 
     def _apply_company_adjustments(
-        self, base_value: "Decimal", value_label: str = "base value"
-    ) -> tuple["Decimal", "Decimal", list[str]]:
+        self, base_value: Decimal, value_label: str = "base value"
+    ) -> tuple[Decimal, Decimal, list[str]]:
         """Apply company-specific adjustments and add audit step.
 
         Args:
@@ -84,47 +116,15 @@ class ValuationMethod(ABC):
         Returns:
             Tuple of (final_value, combined_factor, adjustment_derivation_parts).
         """
-        from decimal import Decimal
-        from src.utils.math_utils import format_currency, round_decimal
-
-        final_value = base_value
-        combined_factor = Decimal("1.0")
-        adjustment_derivation_parts: list[str] = []
-
-        if self.company_data.adjustments:
-            adjustment_list = []
-
-            for adj in self.company_data.adjustments:
+        adjustments = self.company_data.adjustments
+        if not self._trail:
+            # Without a trail only the combined factor is needed
+            combined_factor = _NO_ADJUSTMENT
+            for adj in adjustments:
                 combined_factor *= adj.factor
-                pct_change = (adj.factor - 1) * 100
-                sign = "+" if pct_change >= 0 else ""
-                adjustment_list.append({
-                    "name": adj.name,
-                    "impact": f"{sign}{round_decimal(pct_change, 0)}%",
-                    "reason": adj.reason,
-                })
-                adjustment_derivation_parts.append(
-                    f"{adj.name} ({sign}{round_decimal(pct_change, 0)}%)"
-                )
-
-            final_value = base_value * combined_factor
-            total_adjustment_pct = (combined_factor - 1) * 100
-            total_sign = "+" if total_adjustment_pct >= 0 else ""
+            return base_value * combined_factor, combined_factor, []
 
-            self._add_step(
-                description="Company-Specific Adjustments",
-                inputs={
-                    "type": "company_adjustments",
-                    "adjustments": adjustment_list,
-                    "total_adjustment": f"{total_sign}{round_decimal(total_adjustment_pct, 1)}%",
-                },
-                calculation=(
-                    f"Combined adjustment of {total_sign}{round_decimal(total_adjustment_pct, 1)}% "
-                    f"applied to {value_label}."
-                ),
-                result=f"Adjusted valuation: {format_currency(final_value)}",
-            )
-        else:
+        if not adjustments:
             self._add_step(
                 description="Company-Specific Adjustments",
                 inputs={
@@ -133,8 +133,41 @@ class ValuationMethod(ABC):
                     "total_adjustment": "0%",
                 },
                 calculation="No company-specific adjustments applied.",
-                result=f"Adjusted valuation: {format_currency(final_value)}",
+                result=f"Adjusted valuation: {format_currency(base_value)}",
             )
+            return base_value, _NO_ADJUSTMENT, []
+
+        combined_factor = _NO_ADJUSTMENT
+        adjustment_list: list[dict[str, str]] = []
+        adjustment_derivation_parts: list[str] = []
+
+        for adj in adjustments:
+            combined_factor *= adj.factor
+            pct_change = (adj.factor - 1) * 100
+            sign = "+" if pct_change >= 0 else ""
+            impact = f"{sign}{round_decimal(pct_change, 0)}%"
+            adjustment_list.append({
+                "name": adj.name,
+                "impact": impact,
+                "reason": adj.reason,
+            })
+            adjustment_derivation_parts.append(f"{adj.name} ({impact})")
+
+        final_value = base_value * combined_factor
+        total_adjustment_pct = (combined_factor - 1) * 100
+        total_sign = "+" if total_adjustment_pct >= 0 else ""
+        total_str = f"{total_sign}{round_decimal(total_adjustment_pct, 1)}%"
+
+        self._add_step(
+            description="Company-Specific Adjustments",
+            inputs={
+                "type": "company_adjustments",
+                "adjustments": adjustment_list,
+                "total_adjustment": total_str,
+            },
+            calculation=f"Combined adjustment of {total_str} applied to {value_label}.",
+            result=f"Adjusted valuation: {format_currency(final_value)}",
+        )
 
         return final_value, combined_factor, adjustment_derivation_parts
 
@@ -167,11 +200,12 @@ class ValuationMethod(ABC):
         """
         skip_reason = self.check_prerequisites()
         if skip_reason:
-            return MethodSkipped(
+            return MethodSkipped.model_construct(
                 method=self.method_name,
                 reason=skip_reason,
             )
-        return self.execute()
+        with localcontext(_VALUATION_CTX):
+            return self.execute()
 
 
 class MethodRegistry:
@@ -182,6 +216,8 @@ class MethodRegistry:
     """
 
     _methods: dict[MethodName, Type[ValuationMethod]] = {}
+    # Snapshot of registered classes, rebuilt lazily after each registration
+    _methods_tuple: Optional[tuple[Type[ValuationMethod], ...]] = None
 
     @classmethod
     def register(cls, method_class: Type[ValuationMethod]) -> Type[ValuationMethod]:
@@ -204,16 +240,17 @@ class MethodRegistry:
                 f"Method class {method_class.__name__} must have method_name attribute"
             )
         cls._methods[method_class.method_name] = method_class
+        cls._methods_tuple = None
         return method_class
 
     @classmethod
-    def get_methods(cls) -> dict[MethodName, Type[ValuationMethod]]:
+    def get_methods(cls) -> Mapping[MethodName, Type[ValuationMethod]]:
         """Get all registered methods.
 
         Returns:
-            Dict mapping MethodName to method class.
+            Read-only mapping of MethodName to method class.
         """
-        return cls._methods.copy()
+        return MappingProxyType(cls._methods)
 
     @classmethod
     def get_method(cls, name: MethodName) -> Optional[Type[ValuationMethod]]:
@@ -231,20 +268,25 @@ class MethodRegistry:
     def create_all(
         cls,
         company_data: CompanyData,
-        config: ValuationConfig,
-        loader: DataLoader,
-    ) -> list[ValuationMethod]:
+        config: "ValuationConfig",
+        loader: "DataLoader",
+    ) -> Iterator[ValuationMethod]:
         """Create instances of all registered methods.
 
+        Instances are created lazily, one per registered method, as the
+        iterator is consumed.
+
         Args:
             company_data: Company data to value.
             config: Valuation configuration.
             loader: Data loader instance.
 
         Returns:
-            List of instantiated ValuationMethod objects.
+            Iterator of instantiated ValuationMethod objects.
         """
-        return [
+        if cls._methods_tuple is None:
+            cls._methods_tuple = tuple(cls._methods.values())
+        return (
             method_class(company_data, config, loader)
-            for method_class in cls._methods.values()
-        ]
+            for method_class in cls._methods_tuple
+        )
@@ -1,23 +1,49 @@
 """Comparable Companies valuation method."""
 
+import math
+from operator import attrgetter
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from src.config import ValuationConfig
-from src.database.loader import DataLoader
 from src.models import (
     ComparableCompany,
     ComparableSet,
     CompanyData,
+    CompanyStage,
     Confidence,
     MethodName,
     MethodResult,
 )
-from src.utils.math_utils import format_currency, median, percentile, round_decimal
+from src.utils.math_utils import (
+    format_currency,
+    median,
+    percentiles,
+    round_decimal,
+)
 
 from .base import MethodRegistry, ValuationMethod
 
+if TYPE_CHECKING:
+    from src.config import ValuationConfig
+    from src.database.loader import DataLoader
+
+# Illiquidity discount applied to public multiples, by company stage
+_STAGE_DISCOUNTS: dict[CompanyStage, Decimal] = {
+    CompanyStage.SEED: Decimal("0.35"),
+    CompanyStage.SERIES_A: Decimal("0.30"),
+    CompanyStage.SERIES_B: Decimal("0.25"),
+    CompanyStage.SERIES_C: Decimal("0.20"),
+    CompanyStage.GROWTH: Decimal("0.15"),
+}
+_DEFAULT_DISCOUNT = Decimal("0.25")
+# Display names for stages, e.g. "Series A"
+_STAGE_NAMES: dict[CompanyStage, str] = {
+    stage: stage.value.replace("_", " ").title() for stage in CompanyStage
+}
+_ONE = Decimal("1")
+_get_multiple = attrgetter("ev_revenue_multiple")
+
 
 @MethodRegistry.register
 class ComparablesMethod(ValuationMethod):
@@ -25,6 +51,18 @@ class ComparablesMethod(ValuationMethod):
 
     method_name = MethodName.COMPARABLES
 
+    __slots__ = ("_comps",)
+
+    def __init__(
+        self,
+        company_data: CompanyData,
+        config: "ValuationConfig",
+        loader: "DataLoader",
+    ):
+        super().__init__(company_data, config, loader)
+        # Comparables loaded by check_prerequisites, reused by execute
+        self._comps: Optional[ComparableSet] = None
+
     def check_prerequisites(self) -> Optional[str]:
         """Check if Comparables method can be applied."""
         if self.company_data.financials.revenue_ttm is None:
@@ -35,7 +73,8 @@ class ComparablesMethod(ValuationMethod):
 
         sector = self.company_data.company.sector
         try:
-            comps = self.loader.load_comparables(sector)
+            comps = self._comps or self.loader.load_comparables(sector)
+            self._comps = comps
             if len(comps.companies) < self.config.min_comparables:
                 return (
                     f"Insufficient comparables for sector '{sector}'. "
@@ -50,147 +89,162 @@ class ComparablesMethod(ValuationMethod):
         """Execute Comparables valuation."""
         financials = self.company_data.financials
         sector = self.company_data.company.sector
+        sector_display = sector.replace("_", " ").title()
         revenue = financials.revenue_ttm
         assert revenue is not None
 
         # Step 1: Target Company Metrics
-        growth_str = (
-            f"{round_decimal(financials.revenue_growth_yoy * 100, 0)}%"
-            if financials.revenue_growth_yoy
-            else "Not available"
-        )
-        margin_str = (
-            f"{round_decimal(financials.gross_margin * 100, 0)}%"
-            if financials.gross_margin
-            else "Not available"
-        )
+        if self._trail:
+            revenue_str = format_currency(revenue)
+            growth_str = (
+                f"{round_decimal(financials.revenue_growth_yoy * 100, 0)}%"
+                if financials.revenue_growth_yoy
+                else "Not available"
+            )
+            margin_str = (
+                f"{round_decimal(financials.gross_margin * 100, 0)}%"
+                if financials.gross_margin
+                else "Not available"
+            )
 
-        self._add_step(
-            description="Target Company Financial Metrics",
-            inputs={
-                "type": "target_metrics",
-                "annual_revenue": format_currency(revenue),
-                "revenue_growth": growth_str,
-                "gross_margin": margin_str,
-                "sector": sector.replace("_", " ").title(),
-            },
-            result=f"Annual revenue of {format_currency(revenue)} in the {sector.replace('_', ' ').title()} sector",
-        )
+            self._add_step(
+                description="Target Company Financial Metrics",
+                inputs={
+                    "type": "target_metrics",
+                    "annual_revenue": revenue_str,
+                    "revenue_growth": growth_str,
+                    "gross_margin": margin_str,
+                    "sector": sector_display,
+                },
+                result=f"Annual revenue of {revenue_str} in the {sector_display} sector",
+            )
 
         # Step 2: Load and display comparable companies
-        comps = self.loader.load_comparables(sector)
-
-        comparable_list = []
-        for c in comps.companies:
-            growth = (
-                f"{round_decimal(c.revenue_growth_yoy * 100, 0)}%"
-                if c.revenue_growth_yoy
-                else "N/A"
+        # check_prerequisites normally loaded these already
+        comps = self._comps or self.loader.load_comparables(sector)
+
+        # The per-company listing only feeds the audit trail
+        if self._trail:
+            comparable_list = [
+                {
+                    "ticker": c.ticker,
+                    "name": c.name,
+                    "revenue": format_currency(c.revenue_ttm),
+                    "market_cap": format_currency(c.market_cap),
+                    "revenue_multiple": f"{round_decimal(c.ev_revenue_multiple, 1)}x",
+                    "growth": (
+                        f"{round_decimal(c.revenue_growth_yoy * 100, 0)}%"
+                        if c.revenue_growth_yoy
+                        else "N/A"
+                    ),
+                }
+                for c in comps.companies
+            ]
+
+            # Build data source info for citation
+            data_source_info = {}
+            if comps.source:
+                data_source_info = {
+                    "name": comps.source.name,
+                    "retrieved_at": comps.source.retrieved_at.isoformat(),
+                    "citation": f"Public comparable data from {comps.source.name}",
+                }
+
+            self._add_step(
+                description="Comparable Public Companies",
+                inputs={
+                    "type": "comparable_companies",
+                    "sector": sector_display,
+                    "data_as_of": comps.as_of_date.strftime("%B %d, %Y"),
+                    "companies": comparable_list,
+                    "data_source": data_source_info,
+                },
+                result=f"Found {len(comps.companies)} comparable public companies",
             )
-            comparable_list.append({
-                "ticker": c.ticker,
-                "name": c.name,
-                "revenue": format_currency(c.revenue_ttm),
-                "market_cap": format_currency(c.market_cap),
-                "revenue_multiple": f"{round_decimal(c.ev_revenue_multiple, 1)}x",
-                "growth": growth,
-            })
-
-        # Build data source info for citation
-        data_source_info = {}
-        if comps.source:
-            data_source_info = {
-                "name": comps.source.name,
-                "retrieved_at": comps.source.retrieved_at.isoformat(),
-                "citation": f"Public comparable data from {comps.source.name}",
-            }
-
-        self._add_step(
-            description="Comparable Public Companies",
-            inputs={
-                "type": "comparable_companies",
-                "sector": sector.replace("_", " ").title(),
-                "data_as_of": comps.as_of_date.strftime("%B %d, %Y"),
-                "companies": comparable_list,
-                "data_source": data_source_info,
-            },
-            result=f"Found {len(comps.companies)} comparable public companies",
-        )
 
         # Step 3: Calculate multiple statistics
-        multiples = [c.ev_revenue_multiple for c in comps.companies]
-        median_multiple = median(multiples)
-        min_multiple = min(multiples)
-        max_multiple = max(multiples)
-        p25_multiple = percentile(multiples, 25)
-        p75_multiple = percentile(multiples, 75)
-
-        self._add_step(
-            description="Revenue Multiple Analysis",
-            inputs={
-                "type": "multiple_statistics",
-                "lowest": f"{round_decimal(min_multiple, 1)}x",
-                "percentile_25": f"{round_decimal(p25_multiple, 1)}x",
-                "median": f"{round_decimal(median_multiple, 1)}x",
-                "percentile_75": f"{round_decimal(p75_multiple, 1)}x",
-                "highest": f"{round_decimal(max_multiple, 1)}x",
-                "explanation": (
-                    "Revenue multiples show how much investors pay per dollar of revenue. "
-                    "Higher multiples typically reflect faster growth or better margins."
+        # Sort once; min/max are the ends and median/quartiles reuse the order
+        multiples = sorted(map(_get_multiple, comps.companies))
+        median_multiple = median(multiples, presorted=True)
+
+        if self._trail:
+            p25_multiple, p75_multiple = percentiles(
+                multiples, (25, 75), presorted=True
+            )
+            # Format each multiple once; these strings recur across audit steps
+            min_str = f"{round_decimal(multiples[0], 1)}x"
+            median_str = f"{round_decimal(median_multiple, 1)}x"
+            max_str = f"{round_decimal(multiples[-1], 1)}x"
+
+            self._add_step(
+                description="Revenue Multiple Analysis",
+                inputs={
+                    "type": "multiple_statistics",
+                    "lowest": min_str,
+                    "percentile_25": f"{round_decimal(p25_multiple, 1)}x",
+                    "median": median_str,
+                    "percentile_75": f"{round_decimal(p75_multiple, 1)}x",
+                    "highest": max_str,
+                    "explanation": (
+                        "Revenue multiples show how much investors pay per dollar of revenue. "
+                        "Higher multiples typically reflect faster growth or better margins."
+                    ),
+                },
+                calculation=(
+                    f"The median revenue multiple among comparable companies is "
+                    f"{median_str}, ranging from {min_str} to {max_str}."
                 ),
-            },
-            calculation=(
-                f"The median revenue multiple among comparable companies is "
-                f"{round_decimal(median_multiple, 1)}x, ranging from "
-                f"{round_decimal(min_multiple, 1)}x to {round_decimal(max_multiple, 1)}x."
-            ),
-            result=f"Using median multiple of {round_decimal(median_multiple, 1)}x",
-        )
+                result=f"Using median multiple of {median_str}",
+            )
 
         # Step 4: Apply private company discount
-        selected_multiple = self._select_multiple(comps, median_multiple)
+        selected_multiple = self._select_multiple(multiples, median_multiple)
         discount = self._calculate_private_discount()
-        discount_pct = round_decimal(discount * 100, 0)
-        adjusted_multiple = selected_multiple * (Decimal("1") - discount)
-
-        stage_name = self.company_data.company.stage.value.replace("_", " ").title()
-
-        self._add_step(
-            description="Private Company Discount",
-            inputs={
-                "type": "private_discount",
-                "public_multiple": f"{round_decimal(selected_multiple, 1)}x",
-                "discount_percent": f"{discount_pct}%",
-                "company_stage": stage_name,
-                "adjusted_multiple": f"{round_decimal(adjusted_multiple, 2)}x",
-                "explanation": (
-                    f"Private companies trade at a discount to public companies because "
-                    f"their shares cannot be easily sold. As a {stage_name} company, "
-                    f"we apply a {discount_pct}% discount to reflect this illiquidity."
+        adjusted_multiple = selected_multiple * (_ONE - discount)
+
+        if self._trail:
+            discount_pct = round_decimal(discount * 100, 0)
+            selected_str = f"{round_decimal(selected_multiple, 1)}x"
+            adjusted_str = f"{round_decimal(adjusted_multiple, 2)}x"
+            stage_name = _STAGE_NAMES[self.company_data.company.stage]
+
+            self._add_step(
+                description="Private Company Discount",
+                inputs={
+                    "type": "private_discount",
+                    "public_multiple": selected_str,
+                    "discount_percent": f"{discount_pct}%",
+                    "company_stage": stage_name,
+                    "adjusted_multiple": adjusted_str,
+                    "explanation": (
+                        f"Private companies trade at a discount to public companies because "
+                        f"their shares cannot be easily sold. As a {stage_name} company, "
+                        f"we apply a {discount_pct}% discount to reflect this illiquidity."
+                    ),
+                },
+                calculation=(
+                    f"Starting with the {selected_str} public multiple, "
+                    f"we apply a {discount_pct}% private company discount."
                 ),
-            },
-            calculation=(
-                f"Starting with the {round_decimal(selected_multiple, 1)}x public multiple, "
-                f"we apply a {discount_pct}% private company discount."
-            ),
-            result=f"Adjusted multiple: {round_decimal(adjusted_multiple, 2)}x",
-        )
+                result=f"Adjusted multiple: {adjusted_str}",
+            )
 
         # Step 5: Calculate base value from multiples
         base_value = revenue * adjusted_multiple
 
-        self._add_step(
-            description="Base Valuation Calculation",
-            inputs={
-                "type": "final_calculation",
-                "revenue": format_currency(revenue),
-                "multiple": f"{round_decimal(adjusted_multiple, 2)}x",
-            },
-            calculation=(
-                f"{format_currency(revenue)} revenue × {round_decimal(adjusted_multiple, 2)}x multiple"
-            ),
-            result=f"Base value: {format_currency(base_value)}",
-        )
+        if self._trail:
+            self._add_step(
+                description="Base Valuation Calculation",
+                inputs={
+                    "type": "final_calculation",
+                    "revenue": revenue_str,
+                    "multiple": adjusted_str,
+                },
+                calculation=(
+                    f"{revenue_str} revenue × {adjusted_str} multiple"
+                ),
+                result=f"Base value: {format_currency(base_value)}",
+            )
 
         # Step 6: Apply Company-Specific Adjustments
         final_value, combined_factor, adjustment_derivation_parts = (
@@ -198,95 +252,102 @@ class ComparablesMethod(ValuationMethod):
         )
 
         # Step 7: Final Formula Summary
-        # Build variable derivations
-        revenue_derivation = f"Trailing twelve months revenue for {self.company_data.company.name}"
+        if self._trail:
+            # Format the final figures once; the summary step repeats them
+            final_str = format_currency(final_value)
+            factor_str = str(round_decimal(combined_factor, 3))
 
-        multiple_derivation = (
-            f"Median multiple ({round_decimal(median_multiple, 1)}x) with {discount_pct}% private discount"
-        )
+            # Build variable derivations
+            revenue_derivation = f"Trailing twelve months revenue for {self.company_data.company.name}"
 
-        if adjustment_derivation_parts:
-            company_adj_derivation = f"Product of: {', '.join(adjustment_derivation_parts)}"
-        else:
-            company_adj_derivation = "No adjustments applied (factor = 1.0)"
-
-        self._add_step(
-            description="Final Formula Summary",
-            inputs={
-                "type": "final_formula",
-                "formula_template": "V = R × M × C",
-                "formula_display": "Final Value = Revenue × Adjusted Multiple × Company Adjustments",
-                "formula_with_values": (
-                    f"{format_currency(revenue)} × {round_decimal(adjusted_multiple, 2)}x × "
-                    f"{round_decimal(combined_factor, 3)} = {format_currency(final_value)}"
-                ),
-                "variables": [
-                    {
-                        "name": "Annual Revenue",
-                        "symbol": "R",
-                        "value": format_currency(revenue),
-                        "derivation": revenue_derivation,
-                    },
-                    {
-                        "name": "Adjusted Multiple",
-                        "symbol": "M",
-                        "value": f"{round_decimal(adjusted_multiple, 2)}x",
-                        "derivation": multiple_derivation,
-                    },
-                    {
-                        "name": "Company Adjustments",
-                        "symbol": "C",
-                        "value": str(round_decimal(combined_factor, 3)),
-                        "derivation": company_adj_derivation,
-                    },
-                ],
-                "final_value": format_currency(final_value),
-                "method_name": "Comparables",
-            },
-            result=f"Final valuation: {format_currency(final_value)}",
-        )
+            multiple_derivation = (
+                f"Median multiple ({median_str}) with {discount_pct}% private discount"
+            )
+
+            if adjustment_derivation_parts:
+                company_adj_derivation = f"Product of: {', '.join(adjustment_derivation_parts)}"
+            else:
+                company_adj_derivation = "No adjustments applied (factor = 1.0)"
+
+            self._add_step(
+                description="Final Formula Summary",
+                inputs={
+                    "type": "final_formula",
+                    "formula_template": "V = R × M × C",
+                    "formula_display": "Final Value = Revenue × Adjusted Multiple × Company Adjustments",
+                    "formula_with_values": (
+                        f"{revenue_str} × {adjusted_str} × {factor_str} = {final_str}"
+                    ),
+                    "variables": [
+                        {
+                            "name": "Annual Revenue",
+                            "symbol": "R",
+                            "value": revenue_str,
+                            "derivation": revenue_derivation,
+                        },
+                        {
+                            "name": "Adjusted Multiple",
+                            "symbol": "M",
+                            "value": adjusted_str,
+                            "derivation": multiple_derivation,
+                        },
+                        {
+                            "name": "Company Adjustments",
+                            "symbol": "C",
+                            "value": factor_str,
+                            "derivation": company_adj_derivation,
+                        },
+                    ],
+                    "final_value": final_str,
+                    "method_name": "Comparables",
+                },
+                result=f"Final valuation: {final_str}",
+            )
 
         confidence, confidence_explanation = self._determine_confidence(multiples, median_multiple)
 
-        return MethodResult(
+        # All fields are already of their declared types; skip validation
+        return MethodResult.model_construct(
             method=self.method_name,
             value=round_decimal(final_value, 0),
             confidence=confidence,
             confidence_explanation=confidence_explanation,
             audit_trail=self._audit_steps,
-            warnings=self._warnings,
+            warnings=list(self._warnings),
         )
 
     def _select_multiple(
-        self, comps: ComparableSet, median_multiple: Decimal
+        self, multiples: list[Decimal], median_multiple: Decimal
     ) -> Decimal:
-        """Select appropriate multiple based on company characteristics."""
-        multiples = [c.ev_revenue_multiple for c in comps.companies]
+        """Select appropriate multiple based on company characteristics.
 
+        Args:
+            multiples: Comparable revenue multiples, sorted ascending.
+            median_multiple: Median of ``multiples``.
+
+        Returns:
+            The multiple at the configured percentile.
+        """
         if self.config.multiple_percentile == 50:
             return median_multiple
 
-        return percentile(multiples, self.config.multiple_percentile)
+        return percentiles(
+            multiples, (self.config.multiple_percentile,), presorted=True
+        )[0]
 
     def _calculate_private_discount(self) -> Decimal:
         """Calculate illiquidity discount for private company."""
-        stage = self.company_data.company.stage
-
-        stage_discounts = {
-            "seed": Decimal("0.35"),
-            "series_a": Decimal("0.30"),
-            "series_b": Decimal("0.25"),
-            "series_c": Decimal("0.20"),
-            "growth": Decimal("0.15"),
-        }
-
-        return stage_discounts.get(stage.value, Decimal("0.25"))
+        return _STAGE_DISCOUNTS.get(self.company_data.company.stage, _DEFAULT_DISCOUNT)
 
     def _determine_confidence(
         self, multiples: list[Decimal], median_multiple: Decimal
     ) -> tuple[Confidence, str]:
         """Determine confidence based on multiple dispersion.
 
+        Args:
+            multiples: Comparable revenue multiples, sorted ascending.
+            median_multiple: Median of ``multiples``.
+
         Returns:
             Tuple of (confidence level, explanation string).
         """
@@ -297,15 +358,24 @@ class ComparablesMethod(ValuationMethod):
             )
             return Confidence.LOW, explanation
 
-        mean = sum(multiples) / len(multiples)
-        variance = sum((m - mean) ** 2 for m in multiples) / len(multiples)
-        std_dev = variance ** Decimal("0.5")
-        cv = std_dev / mean if mean > 0 else Decimal("1")
-
-        min_multiple = min(multiples)
-        max_multiple = max(multiples)
-
-        if cv < Decimal("0.3"):
+        # CV only selects a confidence bucket, so float precision is plenty.
+        # One pass accumulates both sums; variance = E[x^2] - E[x]^2.
+        n = len(multiples)
+        total = 0.0
+        total_sq = 0.0
+        for m in multiples:
+            v = float(m)
+            total += v
+            total_sq += v * v
+        mean = total / n
+        variance = max(total_sq / n - mean * mean, 0.0)
+        cv = math.sqrt(variance) / mean if mean > 0 else 1.0
+
+        # multiples is sorted, so the extremes are its ends
+        min_multiple = multiples[0]
+        max_multiple = multiples[-1]
+
+        if cv < 0.3:
             explanation = (
                 f"HIGH confidence: The comparable companies have consistent multiples "
                 f"(CV = {cv:.2f}, below 0.30 threshold). "
@@ -314,7 +384,7 @@ class ComparablesMethod(ValuationMethod):
             )
             return Confidence.HIGH, explanation
 
-        if cv < Decimal("0.5"):
+        if cv < 0.5:
             explanation = (
                 f"MEDIUM confidence: The comparable multiples have moderate spread "
                 f"(CV = {cv:.2f}). Multiples range from {min_multiple:.1f}x to {max_multiple:.1f}x. "
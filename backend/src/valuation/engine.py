@@ -2,11 +2,11 @@
 
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import Iterable, Optional
 
 from src.config import ValuationConfig, get_settings
 from src.database.loader import DataLoader
-from src.exceptions import NoValidMethodsError
+from src.exceptions import NoValidMethodsError, ValuationError
 from src.valuation.base import MethodRegistry, ValuationMethod
 from src.models import (
     CompanyData,
@@ -21,8 +21,33 @@ from src.models import (
 )
 from src.utils.math_utils import format_currency, round_decimal
 
-# Import methods to register them
-from src.valuation import last_round, comps  # noqa: F401
+# Bit positions for folding method confidences into a single mask
+_CONF_BIT = {Confidence.HIGH: 0, Confidence.MEDIUM: 1, Confidence.LOW: 2}
+_HIGH_MASK = 1 << _CONF_BIT[Confidence.HIGH]
+_LOW_MASK = 1 << _CONF_BIT[Confidence.LOW]
+
+# Human-readable method names used throughout summaries and explanations
+_METHOD_DISPLAY_NAMES: dict[MethodName, str] = {
+    MethodName.LAST_ROUND: "Last Round",
+    MethodName.COMPARABLES: "Comparables",
+}
+
+# Methods register themselves on import; deferred until the first valuation
+_REGISTERED = False
+
+
+def _ensure_methods_registered() -> None:
+    """Import the built-in valuation methods so they register themselves.
+
+    Deferred so that importing the engine (e.g. from migrations or admin
+    scripts) does not pay for loading every method module.
+    """
+    global _REGISTERED
+    if _REGISTERED:
+        return
+    from src.valuation import last_round, comps  # noqa: F401
+
+    _REGISTERED = True
 
 
 class ValuationEngine:
@@ -43,6 +68,9 @@ class ValuationEngine:
         settings = get_settings()
         self.loader = loader or DataLoader(settings)
         self.config = config or settings.valuation_config
+        # Spread thresholds as percentages, used when comparing spread_percent
+        self._high_spread_pct = self.config.high_confidence_spread * 100
+        self._med_spread_pct = self.config.medium_confidence_spread * 100
 
     def run(self, company_id: str) -> ValuationResult:
         """Run valuation for a company by ID.
@@ -60,6 +88,30 @@ class ValuationEngine:
         company_data = self.loader.load_company(company_id)
         return self.run_with_data(company_data)
 
+    def run_batch(
+        self, company_ids: Iterable[str]
+    ) -> list[ValuationResult | ValuationError]:
+        """Run valuations for several companies with one engine and loader.
+
+        Market index series, comparable sets and method registration are
+        loaded once and shared by every company in the batch.
+
+        Args:
+            company_ids: Company identifiers, in the order results are wanted.
+
+        Returns:
+            One entry per company: its ValuationResult, or the ValuationError
+            that stopped it.
+        """
+        _ensure_methods_registered()
+        results: list[ValuationResult | ValuationError] = []
+        for company_id in company_ids:
+            try:
+                results.append(self.run(company_id))
+            except ValuationError as e:
+                results.append(e)
+        return results
+
     def run_with_data(self, company_data: CompanyData) -> ValuationResult:
         """Run valuation with provided company data.
 
@@ -73,6 +125,7 @@ class ValuationEngine:
             NoValidMethodsError: If no methods can be executed.
         """
         # Create method instances
+        _ensure_methods_registered()
         methods = MethodRegistry.create_all(company_data, self.config, self.loader)
 
         # Run all methods
@@ -81,10 +134,12 @@ class ValuationEngine:
 
         for method in methods:
             result = method.run()
-            if isinstance(result, MethodResult):
-                results.append(result)
-            else:
+            # run() returns exactly one of these two classes, so an identity
+            # check on the type is enough (no __instancecheck__ dispatch)
+            if type(result) is MethodSkipped:
                 skipped.append(result)
+            else:
+                results.append(result)
 
         # Check if we have any valid results
         if not results:
@@ -104,7 +159,8 @@ class ValuationEngine:
             if isinstance(value, Decimal):
                 config_snapshot[key] = str(value)
 
-        return ValuationResult(
+        # All fields are already of their declared types; skip validation
+        return ValuationResult.model_construct(
             company_id=company_data.company.id,
             company_name=company_data.company.name,
             valuation_date=date.today(),
@@ -127,9 +183,15 @@ class ValuationEngine:
         if len(results) < 2:
             return ""
 
-        values = {r.method.value: r.value for r in results}
-        min_value = min(values.values())
-        max_value = max(values.values())
+        # Track both extremes, and the methods that produced them, in one pass
+        min_r = max_r = results[0]
+        for r in results[1:]:
+            if r.value < min_r.value:
+                min_r = r
+            elif r.value > max_r.value:
+                max_r = r
+        min_value, min_method = min_r.value, min_r.method.value
+        max_value, max_method = max_r.value, max_r.method.value
 
         # Calculate spread
         if min_value > 0:
@@ -137,34 +199,27 @@ class ValuationEngine:
         else:
             spread = Decimal("0")
 
-        # Find which methods produced which values
-        min_method = [m for m, v in values.items() if v == min_value][0]
-        max_method = [m for m, v in values.items() if v == max_value][0]
-
-        analysis_parts = [
-            f"Cross-method comparison: {len(results)} methods executed.",
-            f"Value range: {format_currency(min_value)} ({min_method}) to "
-            f"{format_currency(max_value)} ({max_method}).",
-            f"Spread: {round_decimal(spread * 100, 1)}%.",
-        ]
-
         # Add warning for high spread
         if spread > self.config.medium_confidence_spread:
-            analysis_parts.append(
+            spread_note = (
                 "WARNING: High spread between methods suggests significant "
                 "uncertainty in valuation."
             )
         elif spread > self.config.high_confidence_spread:
-            analysis_parts.append(
+            spread_note = (
                 "Note: Moderate spread between methods. Consider weighting "
                 "towards higher-confidence method."
             )
         else:
-            analysis_parts.append(
-                "Low spread indicates good agreement between methods."
-            )
+            spread_note = "Low spread indicates good agreement between methods."
 
-        return " ".join(analysis_parts)
+        return (
+            f"Cross-method comparison: {len(results)} methods executed. "
+            f"Value range: {format_currency(min_value)} ({min_method}) to "
+            f"{format_currency(max_value)} ({max_method}). "
+            f"Spread: {round_decimal(spread * 100, 1)}%. "
+            f"{spread_note}"
+        )
 
     def _summarize(
         self,
@@ -206,34 +261,33 @@ class ValuationEngine:
         overall_confidence, confidence_explanation = self._calculate_overall_confidence(results)
 
         # Generate summary text
-        summary_parts = [
-            f"Primary valuation: {format_currency(primary.value)} ",
-            f"(via {primary.method.value} method, {primary.confidence.value} confidence).",
-        ]
+        summary_text = (
+            f"Primary valuation: {format_currency(primary.value)} "
+            f"(via {primary.method.value} method, {primary.confidence.value} confidence)."
+        )
 
         if len(results) > 1:
-            other_methods = [r for r in results if r != primary]
-            method_summaries = [
+            method_summaries = ", ".join(
                 f"{r.method.value}: {format_currency(r.value)}"
-                for r in other_methods
-            ]
-            summary_parts.append(
-                f" Supporting methods: {', '.join(method_summaries)}."
+                for r in results
+                if r is not primary
             )
+            summary_text += f" Supporting methods: {method_summaries}."
 
         # Generate method comparison data and selection reason
         method_comparison, selection_reason = self._generate_method_comparison(
             results, primary
         )
 
-        return ValuationSummary(
+        # All fields are already of their declared types; skip validation
+        return ValuationSummary.model_construct(
             primary_value=primary.value,
             primary_method=primary.method,
             value_range_low=value_range_low,
             value_range_high=value_range_high,
             overall_confidence=overall_confidence,
             confidence_explanation=confidence_explanation,
-            summary_text="".join(summary_parts),
+            summary_text=summary_text,
             selection_reason=selection_reason,
             method_comparison=method_comparison,
         )
@@ -252,13 +306,13 @@ class ValuationEngine:
         Returns:
             Tuple of (MethodComparisonData, selection_reason string).
         """
-        # Build method comparison items
+        # Build method comparison items (copied from validated results)
         method_items = [
-            MethodComparisonItem(
+            MethodComparisonItem.model_construct(
                 method=r.method,
                 value=r.value,
                 confidence=r.confidence,
-                is_primary=(r.method == primary.method),
+                is_primary=(r is primary),
             )
             for r in results
         ]
@@ -274,12 +328,12 @@ class ValuationEngine:
             if min_val > 0:
                 spread_percent = round_decimal((max_val - min_val) / min_val * 100, 1)
 
-                if spread_percent > self.config.medium_confidence_spread * 100:
+                if spread_percent > self._med_spread_pct:
                     spread_warning = (
                         f"{spread_percent}% spread between methods indicates "
                         "significant uncertainty in valuation."
                     )
-                elif spread_percent > self.config.high_confidence_spread * 100:
+                elif spread_percent > self._high_spread_pct:
                     spread_warning = (
                         f"{spread_percent}% spread between methods indicates "
                         "moderate uncertainty."
@@ -292,7 +346,7 @@ class ValuationEngine:
         selection_reason = self._generate_selection_reason(results, primary, spread_percent)
 
         return (
-            MethodComparisonData(
+            MethodComparisonData.model_construct(
                 methods=method_items,
                 spread_percent=spread_percent,
                 spread_warning=spread_warning,
@@ -315,31 +369,32 @@ class ValuationEngine:
         Returns:
             List of selection step descriptions.
         """
-        steps = []
-
-        # Step 1: List applicable methods
-        method_list = ", ".join(
-            f"{self._method_display_name(r.method)}"
-            for r in results
-        )
-        steps.append(f"Ran all applicable valuation methods: {method_list}")
+        # Resolve display names once and reuse them across all steps
+        names = [self._method_display_name(r.method) for r in results]
+        primary_name = names[next(i for i, r in enumerate(results) if r is primary)]
 
-        # Step 2: Assess confidence
+        # Step 2 detail: confidence per method, with the first warning if any
         confidence_details = []
-        for r in results:
-            conf_detail = f"{self._method_display_name(r.method)}: {r.confidence.value.upper()}"
-            if r.warnings:
-                conf_detail += f" ({r.warnings[0][:50]}...)" if len(r.warnings[0]) > 50 else f" ({r.warnings[0]})"
-            confidence_details.append(conf_detail)
-        steps.append(f"Assessed confidence: {'; '.join(confidence_details)}")
-
-        # Step 3: Selection result
-        steps.append(
-            f"Selected {self._method_display_name(primary.method)} as primary "
-            f"({primary.confidence.value} confidence)"
-        )
+        for name, r in zip(names, results):
+            if not r.warnings:
+                confidence_details.append(f"{name}: {r.confidence.value.upper()}")
+                continue
+            warning = r.warnings[0]
+            if len(warning) > 50:
+                warning = f"{warning[:50]}..."
+            confidence_details.append(
+                f"{name}: {r.confidence.value.upper()} ({warning})"
+            )
 
-        return steps
+        return [
+            # Step 1: List applicable methods
+            f"Ran all applicable valuation methods: {', '.join(names)}",
+            # Step 2: Assess confidence
+            f"Assessed confidence: {'; '.join(confidence_details)}",
+            # Step 3: Selection result
+            f"Selected {primary_name} as primary "
+            f"({primary.confidence.value} confidence)",
+        ]
 
     def _generate_selection_reason(
         self,
@@ -370,25 +425,20 @@ class ValuationEngine:
             results, key=lambda r: confidence_order[r.confidence]
         )
 
-        parts = [
-            f"We used {len(results)} valuation methods. "
-            f"{self._method_display_name(primary.method)} was selected as primary "
-        ]
-
         # Explain why this method was chosen
-        other_results = [r for r in sorted_results if r.method != primary.method]
+        other_results = [r for r in sorted_results if r is not primary]
 
         if all(r.confidence == primary.confidence for r in results):
             # Same confidence - explain the tiebreaker with principled reasoning
             if primary.method == MethodName.LAST_ROUND:
-                parts.append(
+                because = (
                     f"because both methods have {primary.confidence.value} confidence, "
                     f"and Last Round reflects what informed investors actually paid for "
                     f"this specific company after due diligence, rather than an estimate "
                     f"derived from similar but different public companies."
                 )
             else:
-                parts.append(
+                because = (
                     f"because both methods have {primary.confidence.value} confidence, "
                     f"and Comparables uses current market data which may better reflect "
                     f"today's valuation environment."
@@ -396,31 +446,37 @@ class ValuationEngine:
         elif primary.confidence != other_results[0].confidence:
             # Higher confidence
             other_conf = other_results[0].confidence.value
-            parts.append(
+            because = (
                 f"because it has higher confidence "
                 f"({primary.confidence.value.capitalize()} vs {other_conf.capitalize()})."
             )
         else:
-            parts.append(f"based on confidence assessment.")
+            because = "based on confidence assessment."
+
+        reason = (
+            f"We used {len(results)} valuation methods. "
+            f"{self._method_display_name(primary.method)} was selected as primary "
+            f"{because}"
+        )
 
         # Add spread context
         if spread_percent is not None:
-            if spread_percent > self.config.medium_confidence_spread * 100:
-                parts.append(
+            if spread_percent > self._med_spread_pct:
+                reason += (
                     f" The {spread_percent}% spread between methods indicates "
                     "significant valuation uncertainty."
                 )
-            elif spread_percent > self.config.high_confidence_spread * 100:
-                parts.append(
+            elif spread_percent > self._high_spread_pct:
+                reason += (
                     f" The {spread_percent}% spread between methods indicates "
                     "moderate uncertainty."
                 )
             else:
-                parts.append(
+                reason += (
                     f" The {spread_percent}% spread shows good agreement between methods."
                 )
 
-        return "".join(parts)
+        return reason
 
     def _method_display_name(self, method: MethodName) -> str:
         """Get display name for a method.
@@ -431,11 +487,10 @@ class ValuationEngine:
         Returns:
             Human-readable method name.
         """
-        display_names = {
-            MethodName.LAST_ROUND: "Last Round",
-            MethodName.COMPARABLES: "Comparables",
-        }
-        return display_names.get(method, method.value.replace("_", " ").title())
+        try:
+            return _METHOD_DISPLAY_NAMES[method]
+        except KeyError:
+            return method.value.replace("_", " ").title()
 
     def _calculate_overall_confidence(
         self, results: list[MethodResult]
@@ -449,8 +504,6 @@ class ValuationEngine:
         Returns:
             Tuple of (confidence level, explanation string).
         """
-        confidences = [r.confidence for r in results]
-
         # Single method case
         if len(results) == 1:
             explanation = (
@@ -459,10 +512,19 @@ class ValuationEngine:
             )
             return results[0].confidence, explanation
 
-        # Multiple methods - check agreement
-        values = [r.value for r in results]
-        min_val = min(values)
-        max_val = max(values)
+        # Multiple methods - collect confidence mask and value range in one pass
+        mask = 0
+        min_val = max_val = results[0].value
+        for r in results:
+            mask |= 1 << _CONF_BIT[r.confidence]
+            if r.value < min_val:
+                min_val = r.value
+            elif r.value > max_val:
+                max_val = r.value
+        has_high = mask & _HIGH_MASK
+        has_low = mask & _LOW_MASK
+        all_high = mask == _HIGH_MASK
+
         spread = (max_val - min_val) / min_val if min_val > 0 else Decimal("1")
         spread_pct = round_decimal(spread * 100, 1)
 
@@ -472,35 +534,38 @@ class ValuationEngine:
             for r in results
         )
 
+        high_spread = self.config.high_confidence_spread
+        medium_spread = self.config.medium_confidence_spread
+
         # If methods agree well
-        if spread <= self.config.high_confidence_spread:
-            if Confidence.HIGH in confidences:
+        if spread <= high_spread:
+            if has_high:
                 explanation = (
                     f"HIGH confidence: Methods agree well ({spread_pct}% spread, "
-                    f"below {round_decimal(self.config.high_confidence_spread * 100, 0)}% threshold). "
+                    f"below {round_decimal(self._high_spread_pct, 0)}% threshold). "
                     f"Values: {method_values}. "
                     f"Using highest individual method confidence."
                 )
                 return Confidence.HIGH, explanation
             explanation = (
                 f"MEDIUM confidence: Methods agree well ({spread_pct}% spread, "
-                f"below {round_decimal(self.config.high_confidence_spread * 100, 0)}% threshold). "
+                f"below {round_decimal(self._high_spread_pct, 0)}% threshold). "
                 f"Values: {method_values}. "
                 f"No method has HIGH confidence individually."
             )
             return Confidence.MEDIUM, explanation
 
         # Moderate disagreement
-        if spread <= self.config.medium_confidence_spread:
-            if all(c == Confidence.HIGH for c in confidences):
+        if spread <= medium_spread:
+            if all_high:
                 explanation = (
                     f"MEDIUM confidence: Moderate spread between methods ({spread_pct}%, "
-                    f"below {round_decimal(self.config.medium_confidence_spread * 100, 0)}% threshold). "
+                    f"below {round_decimal(self._med_spread_pct, 0)}% threshold). "
                     f"Values: {method_values}. "
                     f"Confidence capped at MEDIUM despite individual HIGH confidence."
                 )
                 return Confidence.MEDIUM, explanation
-            if Confidence.LOW in confidences:
+            if has_low:
                 explanation = (
                     f"LOW confidence: Moderate spread between methods ({spread_pct}%), "
                     f"and at least one method has LOW confidence. "
@@ -509,7 +574,7 @@ class ValuationEngine:
                 return Confidence.LOW, explanation
             explanation = (
                 f"MEDIUM confidence: Moderate spread between methods ({spread_pct}%, "
-                f"below {round_decimal(self.config.medium_confidence_spread * 100, 0)}% threshold). "
+                f"below {round_decimal(self._med_spread_pct, 0)}% threshold). "
                 f"Values: {method_values}."
             )
             return Confidence.MEDIUM, explanation
@@ -518,7 +583,7 @@ class ValuationEngine:
         explanation = (
             f"LOW confidence: The methods produced values of {method_values} "
             f"({spread_pct}% spread). When methods disagree by more than "
-            f"{round_decimal(self.config.medium_confidence_spread * 100, 0)}%, "
+            f"{round_decimal(self._med_spread_pct, 0)}%, "
             f"overall confidence is LOW regardless of individual method confidence. "
             f"This flags the valuation for manual review."
         )
@@ -2,13 +2,13 @@
 
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping, Optional
 
-from src.config import ValuationConfig
-from src.database.loader import DataLoader
 from src.models import (
     CompanyData,
     Confidence,
+    DataSource,
     MethodName,
     MethodResult,
 )
@@ -16,6 +16,16 @@ from src.utils.math_utils import format_currency, round_decimal
 
 from .base import MethodRegistry, ValuationMethod
 
+if TYPE_CHECKING:
+    from src.config import ValuationConfig
+    from src.database.loader import DataLoader
+
+_ONE = Decimal("1.0")
+
+# Read-only index citations, keyed by index name, paired with the
+# DataSource they were built from
+_citation_cache: dict[str, tuple[DataSource, Mapping[str, str]]] = {}
+
 
 @MethodRegistry.register
 class LastRoundMethod(ValuationMethod):
@@ -23,23 +33,26 @@ class LastRoundMethod(ValuationMethod):
 
     method_name = MethodName.LAST_ROUND
 
+    __slots__ = ("_index_name", "_today", "_months_old")
+
     def __init__(
         self,
         company_data: CompanyData,
-        config: ValuationConfig,
-        loader: DataLoader,
+        config: "ValuationConfig",
+        loader: "DataLoader",
     ):
         super().__init__(company_data, config, loader)
         self._index_name = "NASDAQ"
+        # Set by _round_age so the prerequisite check and execute agree
+        self._today: Optional[date] = None
+        self._months_old: Optional[int] = None
 
     def check_prerequisites(self) -> Optional[str]:
         """Check if Last Round method can be applied."""
         if self.company_data.last_round is None:
             return "No last funding round data available"
 
-        round_date = self.company_data.last_round.date
-        today = date.today()
-        months_old = (today.year - round_date.year) * 12 + (today.month - round_date.month)
+        _, months_old = self._round_age()
 
         if months_old > self.config.max_round_age_months:
             return (
@@ -63,26 +76,25 @@ class LastRoundMethod(ValuationMethod):
 
         # Step 1: Establish Anchor Value
         anchor_value = last_round.valuation_post
+        anchor_str = format_currency(anchor_value)
         round_date_str = last_round.date.strftime("%B %d, %Y")
 
-        self._add_step(
-            description="Starting Point: Last Funding Round",
-            inputs={
-                "type": "funding_round",
-                "round_date": round_date_str,
-                "pre_money_valuation": format_currency(last_round.valuation_pre),
-                "amount_raised": format_currency(last_round.amount_raised),
-                "post_money_valuation": format_currency(last_round.valuation_post),
-                "lead_investor": last_round.lead_investor or "Not disclosed",
-            },
-            result=f"Starting valuation: {format_currency(anchor_value)}",
-        )
+        if self._trail:
+            self._add_step(
+                description="Starting Point: Last Funding Round",
+                inputs={
+                    "type": "funding_round",
+                    "round_date": round_date_str,
+                    "pre_money_valuation": format_currency(last_round.valuation_pre),
+                    "amount_raised": format_currency(last_round.amount_raised),
+                    "post_money_valuation": anchor_str,
+                    "lead_investor": last_round.lead_investor or "Not disclosed",
+                },
+                result=f"Starting valuation: {anchor_str}",
+            )
 
         # Check for stale round warning
-        today = date.today()
-        months_old = (today.year - last_round.date.year) * 12 + (
-            today.month - last_round.date.month
-        )
+        today, months_old = self._round_age()
         if months_old > self.config.stale_round_threshold_months:
             self._add_warning(
                 f"This funding round is {months_old} months old. Market conditions "
@@ -90,9 +102,10 @@ class LastRoundMethod(ValuationMethod):
             )
 
         # Step 2: Calculate Market Adjustment with detailed breakdown
-        index_data = self.loader.get_index(self._index_name)
-        round_index = self._get_closest_index_value(index_data, last_round.date)
-        today_index = self._get_closest_index_value(index_data, today)
+        round_index = self.loader.get_closest_index_value(
+            self._index_name, last_round.date
+        )
+        today_index = self.loader.get_closest_index_value(self._index_name, today)
 
         market_return = (today_index - round_index) / round_index
         market_return_pct = market_return * 100
@@ -110,44 +123,49 @@ class LastRoundMethod(ValuationMethod):
 
         beta = self.config.default_beta
         adjusted_return = beta * market_return
-        market_adjustment = Decimal("1.0") + adjusted_return
-        market_adjusted_value = anchor_value * market_adjustment
-
-        # Get data source info for citation
-        index_source = self.loader.get_index_source(self._index_name)
-        data_source_info = {
-            "name": index_source.name,
-            "retrieved_at": index_source.retrieved_at.isoformat(),
-            "citation": f"Market index data from {index_source.name}",
-        }
-
-        self._add_step(
-            description="Market Adjustment: How Has the Market Moved?",
-            inputs={
-                "type": "market_adjustment",
-                "index_name": self._index_name,
-                "round_date": round_date_str,
-                "round_index_value": f"{round_decimal(round_index, 2):,}",
-                "today_date": today.strftime("%B %d, %Y"),
-                "today_index_value": f"{round_decimal(today_index, 2):,}",
-                "market_change_percent": f"{direction_symbol}{round_decimal(market_return_pct, 1)}%",
-                "market_direction": direction,
-                "volatility_factor": str(beta),
-                "volatility_explanation": (
-                    f"Early-stage companies are more volatile than public markets. "
-                    f"We apply a {beta}x factor, meaning if the market moves 10%, "
-                    f"we adjust the valuation by {round_decimal(beta * 10, 0)}%."
+        if adjusted_return:
+            market_adjustment = _ONE + adjusted_return
+            market_adjusted_value = anchor_value * market_adjustment
+        else:
+            # Flat market or zero beta: the anchor carries through unchanged
+            market_adjustment = _ONE
+            market_adjusted_value = anchor_value
+        # The rest of this step is display-only
+        if self._trail:
+            # Rounded percentages recur across the step and the formula summary
+            market_return_rounded = round_decimal(market_return_pct, 1)
+            adjusted_change_str = (
+                f"{direction_symbol}{round_decimal(adjusted_return * 100, 1)}%"
+            )
+            data_source_info = self._data_source_info()
+
+            self._add_step(
+                description="Market Adjustment: How Has the Market Moved?",
+                inputs={
+                    "type": "market_adjustment",
+                    "index_name": self._index_name,
+                    "round_date": round_date_str,
+                    "round_index_value": f"{round_decimal(round_index, 2):,}",
+                    "today_date": today.strftime("%B %d, %Y"),
+                    "today_index_value": f"{round_decimal(today_index, 2):,}",
+                    "market_change_percent": f"{direction_symbol}{market_return_rounded}%",
+                    "market_direction": direction,
+                    "volatility_factor": str(beta),
+                    "volatility_explanation": (
+                        f"Early-stage companies are more volatile than public markets. "
+                        f"We apply a {beta}x factor, meaning if the market moves 10%, "
+                        f"we adjust the valuation by {round_decimal(beta * 10, 0)}%."
+                    ),
+                    "adjusted_change_percent": adjusted_change_str,
+                    "data_source": data_source_info,
+                },
+                calculation=(
+                    f"The {self._index_name} {direction} by {abs(market_return_rounded)}% "
+                    f"since the funding round. Applying the {beta}x volatility factor, "
+                    f"we adjust the valuation by {adjusted_change_str}."
                 ),
-                "adjusted_change_percent": f"{direction_symbol}{round_decimal(adjusted_return * 100, 1)}%",
-                "data_source": data_source_info,
-            },
-            calculation=(
-                f"The {self._index_name} {direction} by {abs(round_decimal(market_return_pct, 1))}% "
-                f"since the funding round. Applying the {beta}x volatility factor, "
-                f"we adjust the valuation by {direction_symbol}{round_decimal(adjusted_return * 100, 1)}%."
-            ),
-            result=f"Market-adjusted valuation: {format_currency(market_adjusted_value)}",
-        )
+                result=f"Market-adjusted valuation: {format_currency(market_adjusted_value)}",
+            )
 
         # Step 3: Apply Company-Specific Adjustments
         final_value, combined_factor, adjustment_derivation_parts = (
@@ -155,71 +173,112 @@ class LastRoundMethod(ValuationMethod):
         )
 
         # Step 4: Final Formula Summary
-        # Build variable derivations
-        post_money_derivation = (
-            f"From {last_round.round_type.value.replace('_', ' ').title()} round on {round_date_str}"
-        ) if hasattr(last_round, 'round_type') else f"From funding round on {round_date_str}"
+        if self._trail:
+            # Format the final figures once; the summary step repeats them
+            final_str = format_currency(final_value)
+            factor_str = str(round_decimal(combined_factor, 3))
+            market_adj_str = str(round_decimal(market_adjustment, 3))
 
-        market_adj_derivation = (
-            f"1 + ({beta} × {round_decimal(market_return_pct, 1)}%) = {round_decimal(market_adjustment, 3)}"
-        )
+            # Build variable derivations
+            post_money_derivation = f"From funding round on {round_date_str}"
 
-        if adjustment_derivation_parts:
-            company_adj_derivation = f"Product of: {', '.join(adjustment_derivation_parts)}"
-        else:
-            company_adj_derivation = "No adjustments applied (factor = 1.0)"
-
-        self._add_step(
-            description="Final Formula Summary",
-            inputs={
-                "type": "final_formula",
-                "formula_template": "V = P × M × C",
-                "formula_display": "Final Value = Post-Money × Market Adjustment × Company Adjustments",
-                "formula_with_values": (
-                    f"{format_currency(anchor_value)} × {round_decimal(market_adjustment, 3)} × "
-                    f"{round_decimal(combined_factor, 3)} = {format_currency(final_value)}"
-                ),
-                "variables": [
-                    {
-                        "name": "Post-Money Valuation",
-                        "symbol": "P",
-                        "value": format_currency(anchor_value),
-                        "derivation": post_money_derivation,
-                    },
-                    {
-                        "name": "Market Adjustment",
-                        "symbol": "M",
-                        "value": str(round_decimal(market_adjustment, 3)),
-                        "derivation": market_adj_derivation,
-                    },
-                    {
-                        "name": "Company Adjustments",
-                        "symbol": "C",
-                        "value": str(round_decimal(combined_factor, 3)),
-                        "derivation": company_adj_derivation,
-                    },
-                ],
-                "final_value": format_currency(final_value),
-                "method_name": "Last Round",
-            },
-            result=f"Final valuation: {format_currency(final_value)}",
-        )
+            market_adj_derivation = (
+                f"1 + ({beta} × {market_return_rounded}%) = {market_adj_str}"
+            )
+
+            if adjustment_derivation_parts:
+                company_adj_derivation = f"Product of: {', '.join(adjustment_derivation_parts)}"
+            else:
+                company_adj_derivation = "No adjustments applied (factor = 1.0)"
+
+            self._add_step(
+                description="Final Formula Summary",
+                inputs={
+                    "type": "final_formula",
+                    "formula_template": "V = P × M × C",
+                    "formula_display": "Final Value = Post-Money × Market Adjustment × Company Adjustments",
+                    "formula_with_values": (
+                        f"{anchor_str} × {market_adj_str} × {factor_str} = {final_str}"
+                    ),
+                    "variables": [
+                        {
+                            "name": "Post-Money Valuation",
+                            "symbol": "P",
+                            "value": anchor_str,
+                            "derivation": post_money_derivation,
+                        },
+                        {
+                            "name": "Market Adjustment",
+                            "symbol": "M",
+                            "value": market_adj_str,
+                            "derivation": market_adj_derivation,
+                        },
+                        {
+                            "name": "Company Adjustments",
+                            "symbol": "C",
+                            "value": factor_str,
+                            "derivation": company_adj_derivation,
+                        },
+                    ],
+                    "final_value": final_str,
+                    "method_name": "Last Round",
+                },
+                result=f"Final valuation: {final_str}",
+            )
 
         confidence, confidence_explanation = self._determine_confidence(months_old)
 
-        return MethodResult(
+        # All fields are already of their declared types; skip validation
+        return MethodResult.model_construct(
             method=self.method_name,
             value=round_decimal(final_value, 0),
             confidence=confidence,
             confidence_explanation=confidence_explanation,
             audit_trail=self._audit_steps,
-            warnings=self._warnings,
+            warnings=list(self._warnings),
         )
 
-    def _get_closest_index_value(self, index_data: list, target_date: date) -> Decimal:
-        """Get index value closest to target date."""
-        closest = min(index_data, key=lambda x: abs((x.date - target_date).days))
-        return closest.value
+    def _data_source_info(self) -> dict[str, str]:
+        """Get the citation dict for the market index.
+
+        The loader hands out the same DataSource until the date changes, so
+        the citation built from it is cached while that object is current.
+        The cached mapping is read-only; each call returns its own copy, so
+        audit steps never share a dict.
+
+        Returns:
+            Dict with the source name, retrieval date and citation text.
+        """
+        index_source = self.loader.get_index_source(self._index_name)
+        cached = _citation_cache.get(self._index_name)
+        if cached is not None and cached[0] is index_source:
+            return dict(cached[1])
+
+        info = MappingProxyType({
+            "name": index_source.name,
+            "retrieved_at": index_source.retrieved_at.isoformat(),
+            "citation": f"Market index data from {index_source.name}",
+        })
+        _citation_cache[self._index_name] = (index_source, info)
+        return dict(info)
+
+    def _round_age(self) -> tuple[date, int]:
+        """Get today's date and the last round's age in months.
+
+        Computed on first use and reused for the rest of this run.
+
+        Returns:
+            Tuple of (today, months since the last round).
+        """
+        if self._today is None or self._months_old is None:
+            assert self.company_data.last_round is not None
+            round_date = self.company_data.last_round.date
+            today = date.today()
+            self._today = today
+            self._months_old = (today.year - round_date.year) * 12 + (
+                today.month - round_date.month
+            )
+        return self._today, self._months_old
 
     def _determine_confidence(self, months_old: int) -> tuple[Confidence, str]:
         """Determine confidence based on round age.
@@ -1,6 +1,11 @@
 """Shared test fixtures for VC Audit Tool."""
 
+import json
+from datetime import date
+from decimal import Decimal
+
 import pytest
+import pytest_asyncio
 from pathlib import Path
 from typing import AsyncGenerator
 
@@ -8,7 +13,16 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from src.config import Settings, ValuationConfig
 from src.database.loader import DataLoader
-from src.database import models
+from src.exceptions import DataNotFoundError
+from src.database import crud, models
+from src.models import (
+    CompanyData,
+    ComparableCompany,
+    ComparableSet,
+    DataSource,
+    MarketIndex,
+)
+from src.utils.serialization import json_dumps
 from src.valuation.engine import ValuationEngine
 
 
@@ -30,6 +44,65 @@ def loader(settings: Settings) -> DataLoader:
     return DataLoader(settings)
 
 
+class JsonDataLoader(DataLoader):
+    """DataLoader that reads the seed JSON files instead of the database.
+
+    All state lives on the instance, so it never touches the loader's
+    process-wide caches.
+    """
+
+    def __init__(self, settings: Settings, data_dir: Path):
+        super().__init__(settings)
+        self._data_dir = data_dir
+
+    def load_company(self, company_id: str) -> CompanyData:
+        path = self._data_dir / "companies" / f"{company_id}.json"
+        if not path.exists():
+            raise DataNotFoundError("Company", company_id)
+        return CompanyData.model_validate_json(path.read_text())
+
+    def _load_index(self, name: str) -> None:
+        if self._indices_cache is None:
+            self._indices_cache = {}
+        if name in self._indices_cache:
+            return
+        raw = json.loads((self._data_dir / "market" / "indices.json").read_text())
+        for idx in raw["indices"]:
+            if idx["name"] == name:
+                self._index_sources[name] = idx["source_name"]
+                self._indices_cache[name] = [
+                    MarketIndex(
+                        date=date.fromisoformat(p["date"]),
+                        value=Decimal(p["value"]),
+                        name=name,
+                    )
+                    for p in idx["data"]
+                ]
+
+    def get_index_source(self, name: str) -> DataSource:
+        self._load_index(name)
+        return DataSource(name=self._index_sources[name], retrieved_at=date.today())
+
+    def load_comparables(self, sector: str) -> ComparableSet:
+        path = self._data_dir / "comparables" / f"{sector}.json"
+        if not path.exists():
+            raise DataNotFoundError("Comparables", sector)
+        raw = json.loads(path.read_text())
+        as_of_date = date.fromisoformat(raw["as_of_date"])
+        return ComparableSet(
+            sector=sector,
+            as_of_date=as_of_date,
+            companies=[ComparableCompany(**c) for c in raw["companies"]],
+            source=DataSource(name=raw["source_name"], retrieved_at=as_of_date),
+        )
+
+
+@pytest.fixture
+def json_loader(settings: Settings, test_data_dir: Path) -> DataLoader:
+    """Create a data loader backed by the seed JSON files (no database)."""
+    return JsonDataLoader(settings, test_data_dir)
+
+
 @pytest.fixture
 def config() -> ValuationConfig:
     """Create default valuation config."""
@@ -42,15 +115,18 @@ def engine(loader: DataLoader, config: ValuationConfig) -> ValuationEngine:
     return ValuationEngine(loader, config)
 
 
-@pytest.fixture
-async def test_db_engine(settings: Settings) -> AsyncGenerator[AsyncEngine, None]:
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def test_db_engine() -> AsyncGenerator[AsyncEngine, None]:
     """Create test database engine.
 
     Uses in-memory SQLite for testing to avoid affecting real database.
+    The schema is created once per test session; tests isolate their
+    writes through db_session's rollback.
     """
     engine = create_async_engine(
         "sqlite+aiosqlite:///:memory:",
         echo=False,
+        json_serializer=json_dumps,
     )
 
     # Create all tables
@@ -63,20 +139,37 @@ async def test_db_engine(settings: Settings) -> AsyncGenerator[AsyncEngine, None
     await engine.dispose()
 
 
-@pytest.fixture
-async def db_session(test_db_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session.
-
-    Each test gets a fresh session that's rolled back after the test.
-    """
-    # Create session factory
-    session_factory = async_sessionmaker(
+@pytest.fixture(scope="session")
+def session_factory(test_db_engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Create the session factory shared by every test."""
+    return async_sessionmaker(
         test_db_engine,
         class_=AsyncSession,
         expire_on_commit=False,
     )
 
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_session(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> AsyncGenerator[AsyncSession, None]:
+    """Create test database session.
+
+    Each test gets a fresh session that's rolled back after the test.
+    CRUD helpers only flush, so nothing outlives the rollback.
+    """
     async with session_factory() as session:
         yield session
         # Rollback any changes after each test
         await session.rollback()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def sample_company(db_session: AsyncSession) -> models.PortfolioCompany:
+    """Create the default "Test Company" used by most CRUD tests."""
+    return await crud.create_portfolio_company(
+        db=db_session,
+        name="Test Company",
+        sector_id="saas",
+        stage="series_a",
+    )
@@ -7,6 +7,7 @@ from uuid import uuid4
 import pytest
 
 from src.database import crud
+from src.utils.serialization import RawJSON
 
 
 @pytest.mark.asyncio
@@ -29,21 +30,13 @@ async def test_create_portfolio_company(db_session):
 
 
 @pytest.mark.asyncio
-async def test_get_portfolio_company_by_id(db_session):
+async def test_get_portfolio_company_by_id(db_session, sample_company):
     """Test retrieving a portfolio company by ID."""
-    # Create a company
-    created = await crud.create_portfolio_company(
-        db=db_session,
-        name="Test Company",
-        sector_id="saas",
-        stage="series_a",
-    )
-
-    # Retrieve it
-    retrieved = await crud.get_portfolio_company_by_id(db_session, created.id)
+    # Retrieve the company created by the fixture
+    retrieved = await crud.get_portfolio_company_by_id(db_session, sample_company.id)
 
     assert retrieved is not None
-    assert retrieved.id == created.id
+    assert retrieved.id == sample_company.id
     assert retrieved.name == "Test Company"
 
 
@@ -54,6 +47,47 @@ async def test_get_nonexistent_company(db_session):
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_get_portfolio_company_id_by_name(db_session):
+    """Test retrieving a portfolio company ID by exact name."""
+    created = await crud.create_portfolio_company(
+        db=db_session,
+        name="Named Company",
+        sector_id="saas",
+        stage="series_a",
+    )
+    await crud.create_portfolio_company(
+        db=db_session,
+        name="Other Company",
+        sector_id="fintech",
+        stage="series_b",
+    )
+
+    assert (
+        await crud.get_portfolio_company_id_by_name(db_session, "Named Company")
+        == created.id
+    )
+    assert await crud.get_portfolio_company_id_by_name(db_session, "Missing") is None
+
+
+@pytest.mark.asyncio
+async def test_get_random_portfolio_company(db_session):
+    """Test selecting a random portfolio company."""
+    assert await crud.get_random_portfolio_company(db_session) is None
+
+    created = await crud.create_portfolio_company(
+        db=db_session,
+        name="Only Company",
+        sector_id="saas",
+        stage="seed",
+    )
+
+    retrieved = await crud.get_random_portfolio_company(db_session)
+
+    assert retrieved is not None
+    assert retrieved.id == created.id
+
+
 @pytest.mark.asyncio
 async def test_list_portfolio_companies(db_session):
     """Test listing portfolio companies."""
@@ -101,20 +135,12 @@ async def test_count_portfolio_companies(db_session):
 
 
 @pytest.mark.asyncio
-async def test_create_valuation(db_session):
+async def test_create_valuation(db_session, sample_company):
     """Test creating a valuation record."""
-    # First create a company
-    company = await crud.create_portfolio_company(
-        db=db_session,
-        name="Test Company",
-        sector_id="saas",
-        stage="series_a",
-    )
-
     # Create a valuation
     valuation = await crud.create_valuation(
         db=db_session,
-        portfolio_company_id=company.id,
+        portfolio_company_id=sample_company.id,
         company_name="Test Company",
         input_snapshot={"test": "data"},
         input_hash="abc123",
@@ -128,7 +154,7 @@ async def test_create_valuation(db_session):
     )
 
     assert valuation.id is not None
-    assert valuation.portfolio_company_id == company.id
+    assert valuation.portfolio_company_id == sample_company.id
     assert valuation.company_name == "Test Company"
     assert valuation.primary_value == Decimal("10000000")
     assert valuation.primary_method == "last_round"
@@ -137,19 +163,72 @@ async def test_create_valuation(db_session):
 
 
 @pytest.mark.asyncio
-async def test_get_valuation_by_id(db_session):
-    """Test retrieving a valuation by ID."""
-    # Create company and valuation
-    company = await crud.create_portfolio_company(
+async def test_create_valuation_for_company(db_session):
+    """Test saving valuations creates the company once and then reuses it."""
+    valuation_kwargs = dict(
+        company_name="New Company",
+        sector_id="saas",
+        stage="seed",
+        input_snapshot={"financials": {"revenue_ttm": "100"}, "last_round": None},
+        primary_value=Decimal("5000000"),
+        primary_method="comparables",
+        value_range_low=None,
+        value_range_high=None,
+        overall_confidence="MEDIUM",
+        summary={},
+        method_results=[],
+    )
+
+    first = await crud.create_valuation_for_company(db=db_session, **valuation_kwargs)
+    second = await crud.create_valuation_for_company(db=db_session, **valuation_kwargs)
+
+    assert first.portfolio_company_id == second.portfolio_company_id
+    assert await crud.count_portfolio_companies(db_session) == 1
+
+    company = await crud.get_portfolio_company_by_id(
+        db_session, first.portfolio_company_id
+    )
+    assert company is not None
+    assert company.financials == {"revenue_ttm": "100"}
+    assert company.adjustments == []
+
+
+@pytest.mark.asyncio
+async def test_create_valuation_for_company_with_raw_json_snapshot(db_session):
+    """Test a pre-serialized snapshot is stored as-is and seeds the company."""
+    valuation = await crud.create_valuation_for_company(
         db=db_session,
-        name="Test Company",
+        company_name="Raw Company",
         sector_id="saas",
-        stage="series_a",
+        stage="seed",
+        input_snapshot=RawJSON('{"financials": {"revenue_ttm": "5"}, "adjustments": []}'),
+        primary_value=Decimal("1000000"),
+        primary_method="last_round",
+        value_range_low=None,
+        value_range_high=None,
+        overall_confidence="low",
+        summary={},
+        method_results=[],
     )
 
+    company = await crud.get_portfolio_company_by_id(
+        db_session, valuation.portfolio_company_id
+    )
+    assert company is not None
+    assert company.financials == {"revenue_ttm": "5"}
+
+    db_session.expunge_all()
+    stored = await crud.get_valuation_by_id(db_session, valuation.id)
+    assert stored is not None
+    assert stored.input_snapshot["financials"] == {"revenue_ttm": "5"}
+
+
+@pytest.mark.asyncio
+async def test_get_valuation_by_id(db_session, sample_company):
+    """Test retrieving a valuation by ID."""
     created = await crud.create_valuation(
         db=db_session,
-        portfolio_company_id=company.id,
+        portfolio_company_id=sample_company.id,
         company_name="Test Company",
         input_snapshot={"test": "data"},
         input_hash="abc123",
@@ -171,21 +250,13 @@ async def test_get_valuation_by_id(db_session):
 
 
 @pytest.mark.asyncio
-async def test_list_recent_valuations(db_session):
+async def test_list_recent_valuations(db_session, sample_company):
     """Test listing recent valuations."""
-    # Create company
-    company = await crud.create_portfolio_company(
-        db=db_session,
-        name="Test Company",
-        sector_id="saas",
-        stage="series_a",
-    )
-
     # Create multiple valuations
     for i in range(3):
         await crud.create_valuation(
             db=db_session,
-            portfolio_company_id=company.id,
+            portfolio_company_id=sample_company.id,
             company_name="Test Company",
             input_snapshot={"iteration": i},
             input_hash=f"hash{i}",
@@ -261,20 +332,12 @@ async def test_list_valuations_by_company(db_session):
 
 
 @pytest.mark.asyncio
-async def test_get_valuation_by_hash(db_session):
+async def test_get_valuation_by_hash(db_session, sample_company):
     """Test finding a valuation by input hash."""
-    # Create company
-    company = await crud.create_portfolio_company(
-        db=db_session,
-        name="Test Company",
-        sector_id="saas",
-        stage="series_a",
-    )
-
     # Create valuation with specific hash
     created = await crud.create_valuation(
         db=db_session,
-        portfolio_company_id=company.id,
+        portfolio_company_id=sample_company.id,
         company_name="Test Company",
         input_snapshot={},
         input_hash="unique_hash_123",
@@ -296,22 +359,14 @@ async def test_get_valuation_by_hash(db_session):
 
 
 @pytest.mark.asyncio
-async def test_delete_portfolio_company(db_session):
+async def test_delete_portfolio_company(db_session, sample_company):
     """Test deleting a portfolio company."""
-    # Create a company
-    company = await crud.create_portfolio_company(
-        db=db_session,
-        name="Test Company",
-        sector_id="saas",
-        stage="series_a",
-    )
-
-    # Delete it
-    deleted = await crud.delete_portfolio_company(db_session, company.id)
+    # Delete the company created by the fixture
+    deleted = await crud.delete_portfolio_company(db_session, sample_company.id)
     assert deleted is True
 
     # Verify it's gone
-    retrieved = await crud.get_portfolio_company_by_id(db_session, company.id)
+    retrieved = await crud.get_portfolio_company_by_id(db_session, sample_company.id)
     assert retrieved is None
 
 
@@ -1,10 +1,34 @@
 """Integration tests for the valuation engine."""
 
+from datetime import date, timedelta
+from decimal import ROUND_HALF_UP, Decimal, localcontext
+
 import pytest
 
+from src.config import ValuationConfig
 from src.valuation.engine import ValuationEngine
 from src.exceptions import NoValidMethodsError
-from src.models import Confidence, MethodName
+from src.models import (
+    Adjustment,
+    Company,
+    CompanyData,
+    Confidence,
+    Financials,
+    LastRound,
+    MethodName,
+    MethodResult,
+    ValuationResult,
+)
+
+
+def _result(method: MethodName, value: str, confidence: Confidence) -> MethodResult:
+    """Build a minimal MethodResult for engine unit tests."""
+    return MethodResult(
+        method=method,
+        value=Decimal(value),
+        confidence=confidence,
+        audit_trail=[],
+    )
 
 
 class TestValuationEngine:
@@ -64,6 +88,17 @@ class TestValuationEngine:
         assert "last_round" in skip_reasons
         assert "comparables" in skip_reasons
 
+    def test_run_batch_reports_errors_inline(self, json_loader, config):
+        """Test that a batch keeps order and returns failures as errors."""
+        engine = ValuationEngine(json_loader, config)
+        results = engine.run_batch(["basis_ai", "prerevenue_no_round"])
+
+        assert len(results) == 2
+        assert isinstance(results[0], ValuationResult)
+        assert results[0].company_id == "basis_ai"
+        assert isinstance(results[1], NoValidMethodsError)
+        assert results[1].details["company_id"] == "prerevenue_no_round"
+
     def test_old_round_only_comps(self, engine: ValuationEngine):
         """Test company with old round only gets Comparables method."""
         result = engine.run("old_round")
@@ -105,6 +140,20 @@ class TestValuationEngine:
                 assert step.step_number > 0
                 assert len(step.description) > 0
 
+    def test_audit_trail_can_be_disabled(self, json_loader):
+        """Test that disabling the audit trail keeps values but drops steps."""
+        full = ValuationEngine(json_loader, ValuationConfig()).run("basis_ai")
+        bare = ValuationEngine(
+            json_loader, ValuationConfig(include_audit_trail=False)
+        ).run("basis_ai")
+
+        assert len(bare.method_results) == len(full.method_results) == 2
+        for bare_result, full_result in zip(bare.method_results, full.method_results):
+            assert bare_result.value == full_result.value
+            assert bare_result.confidence == full_result.confidence
+            assert bare_result.audit_trail == []
+            assert full_result.audit_trail
+
     def test_summary_generation(self, engine: ValuationEngine):
         """Test that summary is properly generated."""
         result = engine.run("basis_ai")
@@ -122,3 +171,107 @@ class TestValuationEngine:
         if len(result.method_results) > 1:
             assert result.summary.value_range_low is not None
             assert result.summary.value_range_high is not None
+
+
+class TestOverallConfidence:
+    """Unit tests for overall confidence aggregation (no database required)."""
+
+    def test_agreeing_methods_with_high_is_high(self, engine: ValuationEngine):
+        """Test that low spread with a HIGH method yields HIGH."""
+        confidence, _ = engine._calculate_overall_confidence([
+            _result(MethodName.LAST_ROUND, "100", Confidence.HIGH),
+            _result(MethodName.COMPARABLES, "110", Confidence.LOW),
+        ])
+        assert confidence == Confidence.HIGH
+
+    def test_moderate_spread_all_high_capped_at_medium(self, engine: ValuationEngine):
+        """Test that moderate spread caps all-HIGH methods at MEDIUM."""
+        confidence, explanation = engine._calculate_overall_confidence([
+            _result(MethodName.LAST_ROUND, "100", Confidence.HIGH),
+            _result(MethodName.COMPARABLES, "125", Confidence.HIGH),
+        ])
+        assert confidence == Confidence.MEDIUM
+        assert "capped at MEDIUM" in explanation
+
+    def test_moderate_spread_with_low_is_low(self, engine: ValuationEngine):
+        """Test that moderate spread with a LOW method yields LOW."""
+        confidence, _ = engine._calculate_overall_confidence([
+            _result(MethodName.LAST_ROUND, "125", Confidence.MEDIUM),
+            _result(MethodName.COMPARABLES, "100", Confidence.LOW),
+        ])
+        assert confidence == Confidence.LOW
+
+    def test_high_spread_is_low(self, engine: ValuationEngine):
+        """Test that high spread yields LOW regardless of method confidence."""
+        confidence, explanation = engine._calculate_overall_confidence([
+            _result(MethodName.LAST_ROUND, "100", Confidence.HIGH),
+            _result(MethodName.COMPARABLES, "200", Confidence.HIGH),
+        ])
+        assert confidence == Confidence.LOW
+        assert "30%" in explanation
+
+
+class TestLargeValuations:
+    """Test that valuations beyond 12 significant digits stay exact."""
+
+    def test_trillion_dollar_round_is_exact(self, json_loader):
+        """Test a 13-digit last-round valuation computes without overflow."""
+        round_date = date.today() - timedelta(days=90)
+        company_data = CompanyData(
+            company=Company(
+                id="mega_corp", name="Mega Corp", sector="saas", stage="growth"
+            ),
+            financials=Financials(),
+            last_round=LastRound(
+                date=round_date,
+                valuation_pre=Decimal("1200000000000"),
+                valuation_post=Decimal("1500000000007"),
+                amount_raised=Decimal("300000000007"),
+            ),
+            adjustments=[
+                Adjustment(name="Scale", factor=Decimal("1.07"), reason="Market leader")
+            ],
+        )
+        config = ValuationConfig()
+
+        result = ValuationEngine(json_loader, config).run_with_data(company_data)
+
+        round_index = json_loader.get_closest_index_value("NASDAQ", round_date)
+        today_index = json_loader.get_closest_index_value("NASDAQ", date.today())
+        with localcontext() as ctx:
+            ctx.prec = 50
+            expected = (
+                Decimal("1500000000007")
+                * (1 + config.default_beta * (today_index - round_index) / round_index)
+                * Decimal("1.07")
+            ).quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+
+        assert result.method_results[0].method == MethodName.LAST_ROUND
+        assert result.method_results[0].value == expected
+
+
+class TestCitationSharing:
+    """Test cached index citations are not shared between results."""
+
+    def test_market_citation_is_copied_per_result(self, json_loader, monkeypatch):
+        """Test mutating one result's citation leaves later results intact."""
+        source = json_loader.get_index_source("NASDAQ")
+        monkeypatch.setattr(json_loader, "get_index_source", lambda name: source)
+        engine = ValuationEngine(json_loader, ValuationConfig())
+
+        def citation(result: ValuationResult) -> dict:
+            last_round = next(
+                r for r in result.method_results if r.method == MethodName.LAST_ROUND
+            )
+            return next(
+                step.inputs["data_source"]
+                for step in last_round.audit_trail
+                if step.inputs.get("type") == "market_adjustment"
+            )
+
+        first = citation(engine.run("basis_ai"))
+        first["name"] = "tampered"
+        second = citation(engine.run("basis_ai"))
+
+        assert second is not first
+        assert second["name"] == source.name
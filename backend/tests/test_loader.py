@@ -0,0 +1,118 @@
+"""Tests for the DataLoader's shared reference-data caches."""
+
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from src.config import Settings
+from src.database.loader import DataLoader, clear_reference_caches
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    """Start and finish each test with empty shared caches."""
+    clear_reference_caches()
+    yield
+    clear_reference_caches()
+
+
+@pytest.fixture
+def db_reads(monkeypatch) -> list[str]:
+    """Serve fake index and comparable rows and record each database read.
+
+    Returns:
+        List that collects the index name or sector of every read; each
+        read returns a single row whose value (or multiple) is the read's
+        sequence number.
+    """
+    reads: list[str] = []
+
+    @contextmanager
+    def fake_sync_db():
+        yield None
+
+    def fake_time_series(db, name):
+        reads.append(name)
+        return [
+            SimpleNamespace(
+                date=date(2024, 1, 1),
+                value=Decimal(len(reads)),
+                name=name,
+                source_name="Test Source",
+            )
+        ]
+
+    def fake_comparables(db, sector):
+        reads.append(sector)
+        return [
+            SimpleNamespace(
+                ticker="TST",
+                name="Test Corp",
+                sector_id=sector,
+                revenue_ttm=Decimal("100"),
+                market_cap=Decimal("1000"),
+                ev_revenue_multiple=Decimal(len(reads)),
+                revenue_growth_yoy=None,
+                source_name="Test Source",
+                as_of_date=date(2024, 1, 1),
+            )
+        ]
+
+    monkeypatch.setattr("src.database.loader.get_sync_db", fake_sync_db)
+    monkeypatch.setattr(
+        "src.database.loader.crud.get_market_index_time_series_sync",
+        fake_time_series,
+    )
+    monkeypatch.setattr(
+        "src.database.loader.crud.get_comparables_by_sector_sync",
+        fake_comparables,
+    )
+    return reads
+
+
+def _loader(database_url: str) -> DataLoader:
+    """Create a loader pointed at the given database URL."""
+    return DataLoader(Settings(data_dir="data", database_url=database_url))
+
+
+def test_index_series_shared_by_loaders_on_same_database(db_reads):
+    """Test a second loader on the same database reuses the cached series."""
+    first = _loader("postgresql://db-a").get_index("NASDAQ")
+    second = _loader("postgresql://db-a").get_index("NASDAQ")
+
+    assert db_reads == ["NASDAQ"]
+    assert second is first
+
+
+def test_index_series_cached_per_database(db_reads):
+    """Test loaders on different databases never see each other's series."""
+    value_a = _loader("postgresql://db-a").get_index("NASDAQ")[0].value
+    value_b = _loader("postgresql://db-b").get_index("NASDAQ")[0].value
+
+    assert db_reads == ["NASDAQ", "NASDAQ"]
+    assert value_a != value_b
+
+
+def test_clear_reference_caches_forces_reload(db_reads):
+    """Test clearing the caches makes the next loader read the database again."""
+    _loader("postgresql://db-a").get_index("NASDAQ")
+    clear_reference_caches()
+    _loader("postgresql://db-a").get_index("NASDAQ")
+
+    assert db_reads == ["NASDAQ", "NASDAQ"]
+
+
+def test_comparables_cached_per_database(db_reads):
+    """Test comparable sets are shared per database and reset on clear."""
+    first = _loader("postgresql://db-a").load_comparables("saas")
+    assert _loader("postgresql://db-a").load_comparables("saas") is first
+
+    other = _loader("postgresql://db-b").load_comparables("saas")
+    assert other.companies[0].ev_revenue_multiple != first.companies[0].ev_revenue_multiple
+
+    clear_reference_caches()
+    _loader("postgresql://db-a").load_comparables("saas")
+    assert db_reads == ["saas", "saas", "saas"]
@@ -0,0 +1,54 @@
+"""Tests for math utilities."""
+
+from decimal import Decimal
+
+import pytest
+
+from src.utils.math_utils import median, percentile, percentiles
+
+
+def test_median_odd_and_even():
+    """Test median of odd- and even-length sequences."""
+    assert median([Decimal("3"), Decimal("1"), Decimal("2")]) == Decimal("2")
+    assert median([Decimal("4"), Decimal("1"), Decimal("3"), Decimal("2")]) == Decimal("2.5")
+
+
+def test_percentile_interpolates_exactly():
+    """Test that interpolation has no float rounding noise."""
+    values = [Decimal(v) for v in range(1, 35)]  # 1..34
+    # rank = 66 * 33 / 100 = 21.78 -> 22 + 0.78 * (23 - 22)
+    assert percentile(values, 66) == Decimal("22.78")
+
+
+def test_percentile_bounds():
+    """Test percentile at 0, 100 and for a single value."""
+    values = [Decimal("5"), Decimal("1"), Decimal("9")]
+    assert percentile(values, 0) == Decimal("1")
+    assert percentile(values, 100) == Decimal("9")
+    assert percentile([Decimal("7")], 40) == Decimal("7")
+
+
+def test_percentile_invalid():
+    """Test that empty input and out-of-range percentiles are rejected."""
+    with pytest.raises(ValueError):
+        percentile([], 50)
+    with pytest.raises(ValueError):
+        percentile([Decimal("1")], 101)
+
+
+def test_percentiles_matches_percentile():
+    """Test that the batched helper agrees with single lookups."""
+    values = [Decimal("8.5"), Decimal("12.1"), Decimal("6.0"), Decimal("9.9")]
+    assert percentiles(values, (25, 75)) == [
+        percentile(values, 25),
+        percentile(values, 75),
+    ]
+
+
+def test_presorted_skips_sort():
+    """Test that presorted input gives the same results as unsorted input."""
+    values = [Decimal("6.0"), Decimal("8.5"), Decimal("9.9"), Decimal("12.1")]
+    assert median(values, presorted=True) == median(list(reversed(values)))
+    assert percentiles(values, (25, 75), presorted=True) == percentiles(
+        list(reversed(values)), (25, 75)
+    )
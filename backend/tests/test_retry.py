@@ -4,7 +4,7 @@ import asyncio
 
 import pytest
 
-from src.utils.retry import async_retry_on_exception, retry_on_exception
+from src.utils.retry import _resolve_params, async_retry_on_exception, retry_on_exception
 
 
 class TransientError(Exception):
@@ -17,6 +17,23 @@ class PermanentError(Exception):
     pass
 
 
+@pytest.fixture
+def fake_sleep(monkeypatch) -> list[float]:
+    """Record requested backoff waits instead of sleeping.
+
+    Returns:
+        List that collects every delay passed to time.sleep/asyncio.sleep.
+    """
+    delays: list[float] = []
+
+    async def _async_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr("src.utils.retry.time.sleep", delays.append)
+    monkeypatch.setattr("src.utils.retry.asyncio.sleep", _async_sleep)
+    return delays
+
+
 def test_retry_success_first_try():
     """Test successful operation on first attempt."""
     call_count = 0
@@ -32,7 +49,7 @@ def test_retry_success_first_try():
     assert call_count == 1
 
 
-def test_retry_eventual_success():
+def test_retry_eventual_success(fake_sleep):
     """Test operation succeeds after retries."""
     call_count = 0
 
@@ -49,7 +66,7 @@ def test_retry_eventual_success():
     assert call_count == 3
 
 
-def test_retry_max_attempts_exceeded():
+def test_retry_max_attempts_exceeded(fake_sleep):
     """Test max retry attempts are respected."""
     call_count = 0
 
@@ -82,7 +99,7 @@ def test_retry_wrong_exception_not_retried():
     assert call_count == 1
 
 
-def test_retry_multiple_exception_types():
+def test_retry_multiple_exception_types(fake_sleep):
     """Test retry works with multiple exception types."""
     call_count = 0
 
@@ -118,7 +135,7 @@ async def test_async_retry_success_first_try():
 
 
 @pytest.mark.asyncio
-async def test_async_retry_eventual_success():
+async def test_async_retry_eventual_success(fake_sleep):
     """Test async operation succeeds after retries."""
     call_count = 0
 
@@ -136,7 +153,7 @@ async def test_async_retry_eventual_success():
 
 
 @pytest.mark.asyncio
-async def test_async_retry_max_attempts_exceeded():
+async def test_async_retry_max_attempts_exceeded(fake_sleep):
     """Test async max retry attempts are respected."""
     call_count = 0
 
@@ -170,25 +187,117 @@ async def test_async_retry_wrong_exception_not_retried():
     assert call_count == 1
 
 
-def test_retry_exponential_backoff():
+def test_retry_exponential_backoff(fake_sleep):
     """Test that retry delay increases exponentially."""
-    import time
-
-    call_times = []
+    call_count = 0
 
     @retry_on_exception((TransientError,), max_attempts=3, base_delay=0.1, max_delay=1.0)
     def operation():
-        call_times.append(time.time())
-        if len(call_times) < 3:
+        nonlocal call_count
+        call_count += 1
+        if call_count < 3:
             raise TransientError("Retry me")
         return "success"
 
-    operation()
+    assert operation() == "success"
+
+    # First retry waits base_delay, the second doubles it
+    assert fake_sleep == [pytest.approx(0.1), pytest.approx(0.2)]
+
+
+def test_backoff_schedule_is_capped():
+    """Test the precomputed backoff doubles per retry up to max_delay."""
+    attempts, schedule = _resolve_params(5, 0.5, 3.0)
+    assert attempts == 5
+    assert schedule == (0.5, 1.0, 2.0, 3.0)
+
+
+def test_retry_jitter_stays_within_backoff(fake_sleep):
+    """Test jittered waits never exceed the exponential backoff window."""
+
+    @retry_on_exception(
+        (TransientError,), max_attempts=4, base_delay=0.5, max_delay=1.0, jitter=True
+    )
+    def operation():
+        raise TransientError("Retry me")
+
+    with pytest.raises(TransientError):
+        operation()
+
+    assert len(fake_sleep) == 3
+    for wait, cap in zip(fake_sleep, (0.5, 1.0, 1.0)):
+        assert 0 <= wait <= cap
+
+
+def test_fail_cache_is_keyed_per_call_arguments(fake_sleep):
+    """Test an exhausted failure short-circuits only calls with the same arguments."""
+    calls = []
+
+    @retry_on_exception(
+        (TransientError,), max_attempts=2, base_delay=0.01, fail_cache_ttl=60
+    )
+    def operation(name, *, region="us"):
+        calls.append((name, region))
+        raise TransientError(f"{name} down")
+
+    with pytest.raises(TransientError):
+        operation("a")
+    assert len(calls) == 2
+
+    # Same arguments: re-raised without calling again
+    with pytest.raises(TransientError, match="a down") as first:
+        operation("a")
+    with pytest.raises(TransientError) as second:
+        operation("a")
+    assert len(calls) == 2
+    # Each hit raises its own instance
+    assert first.value is not second.value
+
+    # Different arguments still go through
+    with pytest.raises(TransientError):
+        operation("a", region="eu")
+    with pytest.raises(TransientError):
+        operation("b")
+    assert len(calls) == 6
+
+
+def test_fail_cache_skips_non_retryable_errors(fake_sleep):
+    """Test errors outside the retry set are never cached."""
+    call_count = 0
+
+    @retry_on_exception((TransientError,), max_attempts=2, fail_cache_ttl=60)
+    def operation():
+        nonlocal call_count
+        call_count += 1
+        raise PermanentError("Bad input")
+
+    for _ in range(2):
+        with pytest.raises(PermanentError):
+            operation()
+    assert call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_fail_cache_expires(fake_sleep, monkeypatch):
+    """Test async calls go through again once the fail cache TTL passes."""
+    clock = [100.0]
+    monkeypatch.setattr("src.utils.retry.time.monotonic", lambda: clock[0])
+    call_count = 0
+
+    @async_retry_on_exception((TransientError,), max_attempts=1, fail_cache_ttl=5)
+    async def operation():
+        nonlocal call_count
+        call_count += 1
+        raise TransientError("Down")
 
-    # Verify delays increase (approximately)
-    # First retry: ~0.1s, second retry: ~0.2s
-    if len(call_times) >= 3:
-        delay1 = call_times[1] - call_times[0]
-        delay2 = call_times[2] - call_times[1]
-        # Second delay should be roughly double the first
-        assert delay2 > delay1
+    with pytest.raises(TransientError):
+        await operation()
+    clock[0] += 4.9
+    with pytest.raises(TransientError):
+        await operation()
+    assert call_count == 1
+
+    clock[0] += 0.1
+    with pytest.raises(TransientError):
+        await operation()
+    assert call_count == 2
@@ -1,13 +1,21 @@
 """Tests for serialization utilities."""
 
+import json
 from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
-from uuid import UUID, uuid4
+from uuid import UUID
 
 import pytest
+from pydantic import BaseModel
 
-from src.utils.serialization import make_json_serializable
+from src.utils.serialization import RawJSON, json_dumps, make_json_serializable
+
+
+# Fixed values shared by several tests
+_UUID = UUID("12345678-1234-5678-1234-567812345678")
+_DATE = date(2024, 1, 15)
+_DT = datetime(2024, 1, 15, 10, 30, 45)
 
 
 class TestEnum(str, Enum):
@@ -16,6 +24,13 @@ class TestEnum(str, Enum):
     OPTION_B = "option_b"
 
 
+class SampleModel(BaseModel):
+    """Test model for serialization."""
+    name: str
+    amount: Decimal
+    created: date
+
+
 def test_none_value():
     """Test serialization of None."""
     assert make_json_serializable(None) is None
@@ -39,20 +54,17 @@ def test_decimal():
 
 def test_date():
     """Test serialization of date values."""
-    test_date = date(2024, 1, 15)
-    assert make_json_serializable(test_date) == "2024-01-15"
+    assert make_json_serializable(_DATE) == "2024-01-15"
 
 
 def test_datetime():
     """Test serialization of datetime values."""
-    test_dt = datetime(2024, 1, 15, 10, 30, 45)
-    assert make_json_serializable(test_dt) == "2024-01-15T10:30:45"
+    assert make_json_serializable(_DT) == "2024-01-15T10:30:45"
 
 
 def test_uuid():
     """Test serialization of UUID values."""
-    test_uuid = uuid4()
-    assert make_json_serializable(test_uuid) == str(test_uuid)
+    assert make_json_serializable(_UUID) == str(_UUID)
 
 
 def test_enum():
@@ -66,7 +78,7 @@ def test_dict():
     test_dict = {
         "name": "test",
         "amount": Decimal("100.50"),
-        "created": date(2024, 1, 15),
+        "created": _DATE,
     }
     result = make_json_serializable(test_dict)
     assert result == {
@@ -82,7 +94,7 @@ def test_list():
         "string",
         42,
         Decimal("10.5"),
-        date(2024, 1, 15),
+        _DATE,
     ]
     result = make_json_serializable(test_list)
     assert result == [
@@ -104,7 +116,7 @@ def test_nested_structures():
     """Test serialization of nested data structures."""
     test_data = {
         "company": {
-            "id": uuid4(),
+            "id": _UUID,
             "metrics": [
                 {"value": Decimal("100"), "date": date(2024, 1, 1)},
                 {"value": Decimal("200"), "date": date(2024, 2, 1)},
@@ -125,17 +137,10 @@ def test_nested_structures():
 
 def test_pydantic_model():
     """Test serialization of Pydantic models."""
-    from pydantic import BaseModel
-
-    class TestModel(BaseModel):
-        name: str
-        amount: Decimal
-        created: date
-
-    model = TestModel(
+    model = SampleModel(
         name="test",
         amount=Decimal("123.45"),
-        created=date(2024, 1, 15),
+        created=_DATE,
     )
 
     result = make_json_serializable(model)
@@ -155,3 +160,33 @@ def test_unknown_object():
     obj = CustomClass()
     result = make_json_serializable(obj)
     assert result == "custom_object"
+
+
+def test_json_dumps_matches_make_json_serializable():
+    """Test orjson output decodes to the same structure as the slow path."""
+    data = {
+        "value": Decimal("1.50"),
+        "when": _DATE,
+        "id": _UUID,
+        "nested": [{"amount": Decimal("2")}, None, True],
+    }
+
+    assert json.loads(json_dumps(data)) == make_json_serializable(data)
+
+
+def test_json_dumps_passes_raw_json_through():
+    """Test already-serialized JSON is not encoded a second time."""
+    raw = RawJSON('{"a": 1}')
+    assert json_dumps(raw) == '{"a": 1}'
+    assert json_dumps('{"a": 1}') == '"{\\"a\\": 1}"'
+
+
+def test_json_native_containers_are_reused():
+    """Test trees of plain JSON values are returned without copying."""
+    native = {"a": [1, "x", {"b": None}], "c": 2.5}
+    assert make_json_serializable(native) is native
+
+    mixed = {"a": [1, {"b": Decimal("1.5")}]}
+    result = make_json_serializable(mixed)
+    assert result == {"a": [1, {"b": "1.5"}]}
+    assert result is not mixed
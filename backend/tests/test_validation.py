@@ -17,23 +17,11 @@ class TestFinancialsValidation:
         financials = Financials(revenue_ttm=Decimal("1000000"))
         assert financials.revenue_ttm == Decimal("1000000")
 
-    def test_negative_revenue_ttm_rejected(self):
-        """Test that negative revenue_ttm is rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            Financials(revenue_ttm=Decimal("-1000"))
-        assert "Must be positive" in str(exc_info.value)
-
     def test_positive_burn_rate(self):
         """Test that positive burn_rate is accepted."""
         financials = Financials(burn_rate=Decimal("50000"))
         assert financials.burn_rate == Decimal("50000")
 
-    def test_negative_burn_rate_rejected(self):
-        """Test that negative burn_rate is rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            Financials(burn_rate=Decimal("-10000"))
-        assert "Must be positive" in str(exc_info.value)
-
     def test_valid_gross_margin(self):
         """Test that valid gross_margin (0-1) is accepted."""
         financials = Financials(gross_margin=Decimal("0.75"))
@@ -47,17 +35,25 @@ class TestFinancialsValidation:
         financials_one = Financials(gross_margin=Decimal("1"))
         assert financials_one.gross_margin == Decimal("1")
 
-    def test_gross_margin_too_low_rejected(self):
-        """Test that gross_margin < 0 is rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            Financials(gross_margin=Decimal("-0.1"))
-        assert "between 0 and 1" in str(exc_info.value)
-
-    def test_gross_margin_too_high_rejected(self):
-        """Test that gross_margin > 1 is rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            Financials(gross_margin=Decimal("1.5"))
-        assert "between 0 and 1" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        "field,value,message",
+        [
+            ("revenue_ttm", Decimal("-1000"), "Must be positive"),
+            ("burn_rate", Decimal("-10000"), "Must be positive"),
+            ("gross_margin", Decimal("-0.1"), "between 0 and 1"),
+            ("gross_margin", Decimal("1.5"), "between 0 and 1"),
+        ],
+        ids=[
+            "negative_revenue_ttm",
+            "negative_burn_rate",
+            "gross_margin_too_low",
+            "gross_margin_too_high",
+        ],
+    )
+    def test_out_of_range_values_rejected(self, field, value, message):
+        """Test that negative amounts and out-of-range margins are rejected."""
+        with pytest.raises(ValidationError, match=message):
+            Financials(**{field: value})
 
     def test_none_values_accepted(self):
         """Test that None values are accepted for optional fields."""
@@ -85,28 +81,6 @@ class TestLastRoundValidation:
         assert last_round.valuation_pre == Decimal("10000000")
         assert last_round.valuation_post == Decimal("12500000")
 
-    def test_negative_valuation_pre_rejected(self):
-        """Test that negative valuation_pre is rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            LastRound(
-                date=date(2024, 1, 1),
-                valuation_pre=Decimal("-1000000"),
-                valuation_post=Decimal("1000000"),
-                amount_raised=Decimal("2000000"),
-            )
-        assert "Must be positive" in str(exc_info.value)
-
-    def test_zero_valuation_rejected(self):
-        """Test that zero valuations are rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            LastRound(
-                date=date(2024, 1, 1),
-                valuation_pre=Decimal("0"),
-                valuation_post=Decimal("1000000"),
-                amount_raised=Decimal("1000000"),
-            )
-        assert "Must be positive" in str(exc_info.value)
-
     def test_past_date_accepted(self):
         """Test that past dates are accepted."""
         past_date = date.today() - timedelta(days=30)
@@ -118,18 +92,6 @@ class TestLastRoundValidation:
         )
         assert last_round.date == past_date
 
-    def test_future_date_rejected(self):
-        """Test that future dates are rejected."""
-        future_date = date.today() + timedelta(days=30)
-        with pytest.raises(ValidationError) as exc_info:
-            LastRound(
-                date=future_date,
-                valuation_pre=Decimal("10000000"),
-                valuation_post=Decimal("12500000"),
-                amount_raised=Decimal("2500000"),
-            )
-        assert "cannot be in the future" in str(exc_info.value)
-
     def test_valid_post_money_calculation(self):
         """Test that correct post-money calculation is accepted."""
         last_round = LastRound(
@@ -140,16 +102,37 @@ class TestLastRoundValidation:
         )
         assert last_round.valuation_post == Decimal("12500000")
 
-    def test_invalid_post_money_calculation_rejected(self):
-        """Test that incorrect post-money calculation is rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            LastRound(
-                date=date(2024, 1, 1),
-                valuation_pre=Decimal("10000000"),
-                valuation_post=Decimal("15000000"),  # Should be 12.5M
-                amount_raised=Decimal("2500000"),
-            )
-        assert "Post-money must equal pre-money + amount raised" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        "overrides,message",
+        [
+            (
+                {"valuation_pre": Decimal("-1000000"), "valuation_post": Decimal("1000000"),
+                 "amount_raised": Decimal("2000000")},
+                "Must be positive",
+            ),
+            (
+                {"valuation_pre": Decimal("0"), "valuation_post": Decimal("1000000"),
+                 "amount_raised": Decimal("1000000")},
+                "Must be positive",
+            ),
+            ({"date": date.today() + timedelta(days=30)}, "cannot be in the future"),
+            (
+                {"valuation_post": Decimal("15000000")},  # Should be 12.5M
+                "Post-money must equal pre-money \\+ amount raised",
+            ),
+        ],
+        ids=["negative_valuation_pre", "zero_valuation", "future_date", "invalid_post_money"],
+    )
+    def test_invalid_rounds_rejected(self, overrides, message):
+        """Test that bad valuations, future dates and inconsistent post-money are rejected."""
+        fields = {
+            "date": date(2024, 1, 1),
+            "valuation_pre": Decimal("10000000"),
+            "valuation_post": Decimal("12500000"),
+            "amount_raised": Decimal("2500000"),
+        }
+        with pytest.raises(ValidationError, match=message):
+            LastRound(**{**fields, **overrides})
 
     def test_post_money_calculation_with_tolerance(self):
         """Test that small rounding errors in post-money are tolerated."""
@@ -184,26 +167,6 @@ class TestAdjustmentValidation:
         )
         assert adjustment.factor == Decimal("1.0")
 
-    def test_negative_factor_rejected(self):
-        """Test that negative factor is rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            Adjustment(
-                name="Invalid",
-                factor=Decimal("-0.5"),
-                reason="Should fail",
-            )
-        assert "must be positive" in str(exc_info.value)
-
-    def test_zero_factor_rejected(self):
-        """Test that zero factor is rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            Adjustment(
-                name="Invalid",
-                factor=Decimal("0"),
-                reason="Should fail",
-            )
-        assert "must be positive" in str(exc_info.value)
-
     def test_reasonable_high_factor(self):
         """Test that reasonable high factors are accepted."""
         adjustment = Adjustment(
@@ -213,15 +176,19 @@ class TestAdjustmentValidation:
         )
         assert adjustment.factor == Decimal("5.0")
 
-    def test_unreasonably_high_factor_rejected(self):
-        """Test that unreasonably high factors are rejected."""
-        with pytest.raises(ValidationError) as exc_info:
-            Adjustment(
-                name="Too High",
-                factor=Decimal("15.0"),
-                reason="Should fail",
-            )
-        assert "unreasonably high" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        "factor,message",
+        [
+            (Decimal("-0.5"), "must be positive"),
+            (Decimal("0"), "must be positive"),
+            (Decimal("15.0"), "unreasonably high"),
+        ],
+        ids=["negative_factor", "zero_factor", "unreasonably_high_factor"],
+    )
+    def test_out_of_range_factor_rejected(self, factor, message):
+        """Test that non-positive and unreasonably high factors are rejected."""
+        with pytest.raises(ValidationError, match=message):
+            Adjustment(name="Invalid", factor=factor, reason="Should fail")
 
     def test_factor_at_boundary(self):
         """Test factor at the upper boundary (10)."""